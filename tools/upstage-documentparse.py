@@ -1,13 +1,142 @@
 import os
 import logging
-import hashlib
 import json
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from typing import Any, Tuple, Generator
 import requests
+import xxhash
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
-from tools.upstage_client import UpstageDocumentParseClient
+from tools.upstage_client import UpstageDocumentParseClient, create_session
+
+try:
+    import orjson
+
+    def _json_dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode(
+            "utf-8"
+        )
+
+    _json_loads = json.loads
+
+# Chunk size used when streaming downloads to disk (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Prefix marking XXH3-128 file hashes, keeping them apart from legacy MD5 cache keys
+FILE_HASH_PREFIX = "x3_"
+# Downloads up to this size are kept in memory while hashing; larger ones spill
+# to an anonymous temporary file. Nothing is written to the cache on a hit.
+DOWNLOAD_SPOOL_SIZE = 16 * 1024 * 1024
+# Maximum number of downloaded chunks waiting to be written to the spool
+WRITE_QUEUE_DEPTH = 4
+# Background writers flushing downloaded chunks while the caller keeps hashing
+_WRITER_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="upstage-writer")
+# Shared HTTP session for file downloads, so keep-alive connections to the
+# Dify file server are reused across invocations instead of re-handshaking
+_SESSION = create_session()
+# File extension and MIME type for each result type returned as a file
+RESULT_FILE_TYPES = {
+    "md": ("md", "text/markdown"),
+    "html": ("html", "text/html"),
+    "text": ("txt", "text/plain"),
+}
+# Client export format used for each result type
+CONVERTERS = {
+    "md": "markdown",
+    "html": "html",
+    "text": "text",
+}
+# Maximum number of files converted concurrently in one invocation
+MAX_CONCURRENT_FILES = 4
+# Number of decoded conversion results kept in memory
+RESULT_CACHE_SIZE = 128
+
+
+def _write_chunks(f, chunks: queue.Queue) -> None:
+    """
+    Write queued chunks to a file until a None sentinel is received.
+
+    If writing fails, the queue keeps being drained so the producer never blocks on
+    a full queue; the error is re-raised once the sentinel arrives.
+
+    Args:
+        f: Binary file object to write to
+        chunks (queue.Queue): Queue of byte chunks terminated by None
+    """
+    try:
+        # writelines drives the iterator from C, avoiding a Python-level loop per chunk
+        f.writelines(iter(chunks.get, None))
+    except BaseException:
+        while chunks.get() is not None:
+            pass
+        raise
+
+
+def _setup_logging() -> logging.Logger:
+    """
+    Initialize the logging system for the tool.
+
+    Sets up both console and file logging with detailed formatting. Log file is saved
+    as upstage_documentparse.log. Handlers are attached only once per process, and the
+    log level is read from the UPSTAGE_LOG_LEVEL environment variable (default INFO).
+
+    Returns:
+        logging.Logger: The configured tool logger
+    """
+    tool_logger = logging.getLogger("UpstageDocumentparseTool")
+    if not tool_logger.handlers:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        for handler in (
+            logging.StreamHandler(),
+            logging.FileHandler("upstage_documentparse.log"),
+        ):
+            handler.setFormatter(formatter)
+            tool_logger.addHandler(handler)
+        level = os.environ.get("UPSTAGE_LOG_LEVEL", "INFO").upper()
+        valid_level = level in logging.getLevelNamesMapping()
+        tool_logger.setLevel(level if valid_level else logging.INFO)
+        tool_logger.propagate = False
+        tool_logger.info("Logging system initialized")
+        if not valid_level:
+            tool_logger.warning(
+                "Unknown UPSTAGE_LOG_LEVEL %r; falling back to INFO", level
+            )
+    return tool_logger
+
+
+logger = _setup_logging()
+
+
+@lru_cache(maxsize=RESULT_CACHE_SIZE)
+def _read_cached(path: str, mtime_ns: int) -> bytes:
+    """
+    Read a cached conversion result from disk.
+
+    Results are memoized on (path, mtime_ns), so repeated hits on a hot document are
+    served from memory while a rewritten cache file is picked up automatically.
+
+    Args:
+        path (str): Path to the cached result file
+        mtime_ns (int): Modification time of the file in nanoseconds
+
+    Returns:
+        bytes: The cached result as UTF-8 encoded bytes
+    """
+    with open(path, "rb") as f:
+        return f.read()
 
 
 class UpstageDocumentparseTool(Tool):
@@ -26,6 +155,12 @@ class UpstageDocumentparseTool(Tool):
     - Configurable output format (text message or file)
     """
 
+    # Upstage clients shared by all tool instances, keyed by (api_key, model)
+    _clients: dict[tuple[str, str], UpstageDocumentParseClient] = {}
+    _clients_lock = threading.Lock()
+    # Serializes cache index updates across tool instances in this process
+    _cache_index_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the UpstageDocumentparseTool with caching and logging capabilities.
@@ -35,7 +170,8 @@ class UpstageDocumentparseTool(Tool):
             **kwargs: Arbitrary keyword arguments passed to the parent Tool class
         """
         super().__init__(*args, **kwargs)
-        self.client = None
+        # Logger configured once at module import
+        self.logger = logger
         # Temporary output directory
         self.output_dir = "temp_output"
         # Upstage Document Parse Model
@@ -46,64 +182,157 @@ class UpstageDocumentparseTool(Tool):
         # Set up cache directory
         self.cache_dir = os.path.join(self.output_dir, "cache")
         self.cache_index_file = os.path.join(self.cache_dir, "cache_index.json")
-        # Create directory
+        self.cache_journal_file = os.path.join(self.cache_dir, "cache_index.log")
+        # The cache directory and index are set up lazily by conversion_cache
+
+    @cached_property
+    def conversion_cache(self) -> set[str]:
+        """
+        The cache index, loaded on first access.
+
+        Creating the cache directory and reading the index are deferred until a tool
+        invocation actually needs them, so constructing the tool stays cheap.
+
+        Returns:
+            set[str]: The loaded cache index
+        """
         os.makedirs(self.cache_dir, exist_ok=True)
-        # Load cache index
-        self.conversion_cache = self._load_cache_index()
-        # Initialize logging
-        self._setup_logging()
+        return self._load_cache_index()
 
-    def _setup_logging(self) -> None:
+    def _get_client(self, api_key: str) -> UpstageDocumentParseClient:
         """
-        Initialize the logging system for the tool.
+        Return the shared Upstage client for the given API key and the tool's model.
+
+        Clients (and their HTTP connection pools) are created once per process and
+        reused by every tool instance.
+
+        Args:
+            api_key (str): Upstage API key
 
-        Sets up both console and file logging with detailed formatting.
-        Log file is saved as upstage_documentparse.log.
+        Returns:
+            UpstageDocumentParseClient: The shared client
         """
-        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format=log_format,
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler("upstage_documentparse.log"),
-            ],
-        )
-        self.logger = logging.getLogger("UpstageDocumentparseTool")
-        self.logger.info("Logging system initialized")
+        key = (api_key, self.model)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                self.logger.info("Initializing Upstage client")
+                client = UpstageDocumentParseClient(
+                    api_key=api_key,
+                    debug=self.debug,
+                    output_dir=self.output_dir,
+                    model=self.model,
+                )
+                self._clients[key] = client
+        return client
 
-    def _load_cache_index(self) -> dict:
+    def _load_cache_index(self) -> set[str]:
         """
         Load the cache index from the file system.
 
-        The cache index is a dictionary that maps cache keys to boolean values
-        indicating whether corresponding cached results exist.
+        The cache index is the set of cache keys whose converted results exist.
+        It is stored as a JSON snapshot plus an append-only journal of entries
+        added since the last snapshot. The journal is replayed on top of the
+        snapshot, and folded back into a new snapshot once it holds more entries
+        than the snapshot itself.
 
         Returns:
-            dict: The loaded cache index, or an empty dict if no index exists or loading fails
+            set[str]: The loaded cache index, or an empty set if no index exists or loading fails
         """
-        if os.path.exists(self.cache_index_file):
+        # Hold the lock so a concurrent append cannot land between reading the
+        # journal and truncating it during compaction
+        with self._cache_index_lock:
+            index = set()
             try:
-                with open(self.cache_index_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                # Snapshots are JSON arrays; older dict snapshots contribute their keys
+                with open(self.cache_index_file, "rb") as f:
+                    index = set(_json_loads(f.read()))
             except Exception:
-                # Return empty dictionary if loading fails
-                return {}
-        return {}
+                # Start from an empty set if no snapshot exists or loading fails
+                index = set()
+            snapshot_size = len(index)
+
+            journal_entries = 0
+            try:
+                with open(self.cache_journal_file, "rb") as f:
+                    for line in f:
+                        try:
+                            index.update(_json_loads(line))
+                            journal_entries += 1
+                        except Exception:
+                            # Skip blank or partially written lines
+                            continue
+            except FileNotFoundError:
+                pass
+
+            # Older keys also encoded the as_file flag; fold them into "{hash}_{type}"
+            legacy_keys = {key for key in index if key.endswith(("_True", "_False"))}
+            if legacy_keys:
+                index -= legacy_keys
+                index.update(key.rsplit("_", 1)[0] for key in legacy_keys)
+
+            if journal_entries > snapshot_size or legacy_keys:
+                self._compact_cache_index(index)
+        return index
+
+    def _append_cache_entry(self, cache_key: str) -> None:
+        """
+        Record a new cache entry in memory and append it to the cache journal.
+
+        Appending a single line keeps the cost of an insertion independent of the
+        size of the cache index.
 
-    def _save_cache_index(self) -> None:
+        Args:
+            cache_key (str): The cache key to record
+        """
+        # Resolve the lazily loaded index first; loading takes the same lock
+        conversion_cache = self.conversion_cache
+        with self._cache_index_lock:
+            conversion_cache.add(cache_key)
+            with open(self.cache_journal_file, "ab") as f:
+                f.write(_json_dumps_bytes([cache_key], indent=False) + b"\n")
+
+    def _compact_cache_index(self, index: set[str]) -> None:
+        """
+        Fold the cache journal into a fresh snapshot and truncate the journal.
+
+        Must be called with _cache_index_lock held.
+
+        Args:
+            index (set[str]): The full cache index to snapshot
+        """
+        if not self._save_cache_index(index):
+            return
+        try:
+            open(self.cache_journal_file, "wb").close()
+        except Exception as e:
+            self.logger.error("Error occurred while truncating cache journal: %s", e)
+
+    def _save_cache_index(self, index: set[str]) -> bool:
         """
         Save the current cache index to the file system.
 
-        The cache index is saved as a JSON file with UTF-8 encoding and
-        human-readable formatting (with indentation).
+        The cache index is saved as a JSON array with UTF-8 encoding and
+        human-readable formatting (with indentation). orjson is used when
+        available, falling back to the standard library json module. The snapshot
+        is written to a temporary file and atomically swapped into place, so a
+        concurrent reader never sees a partially written index.
+
+        Args:
+            index (set[str]): The cache index to save
+
+        Returns:
+            bool: True if the index was written, False otherwise
         """
         try:
-            with open(self.cache_index_file, "w", encoding="utf-8") as f:
-                json.dump(self.conversion_cache, f, ensure_ascii=False, indent=2)
+            tmp_path = f"{self.cache_index_file}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps_bytes(list(index)))
+            os.replace(tmp_path, self.cache_index_file)
+            return True
         except Exception as e:
-            if hasattr(self, "logger"):
-                self.logger.error(f"Error occurred while saving cache index: {e}")
+            self.logger.error("Error occurred while saving cache index: %s", e)
+            return False
 
     def _get_cache_filepath(self, cache_key: str, result_type: str) -> str:
         """
@@ -118,11 +347,18 @@ class UpstageDocumentparseTool(Tool):
         """
         return os.path.join(self.cache_dir, f"{cache_key}_{result_type}.txt")
 
-    def _download_file(
+    def _download_and_hash(
         self, file, base_url: str, timeout: int = 300
-    ) -> Tuple[bytes, str]:
+    ) -> Tuple[tempfile.SpooledTemporaryFile, str, str]:
         """
-        Download a file from the provided URL.
+        Stream a file from the provided URL into a spooled temporary file while hashing it.
+
+        The response body is consumed in 1 MiB chunks. Each chunk is fed to the hasher
+        on the calling thread and handed to a background writer through a bounded
+        queue, so network reads, hashing and spooling overlap. Files of up to
+        DOWNLOAD_SPOOL_SIZE bytes stay in memory; larger ones spill to an anonymous
+        temporary file. The caller persists the content only on a cache miss (see
+        _persist_download()), so a cache hit writes nothing to the cache directory.
 
         Args:
             file: The file object containing URL and filename
@@ -130,41 +366,88 @@ class UpstageDocumentparseTool(Tool):
             timeout (int, optional): Request timeout in seconds. Defaults to 300.
 
         Returns:
-            Tuple[bytes, str]: A tuple containing the file content as bytes and the file extension
+            Tuple[tempfile.SpooledTemporaryFile, str, str]: A tuple containing the spooled
+                content (owned by the caller, which must close it), the content hash and
+                the file extension
 
         Raises:
             Exception: If download fails due to HTTP error or other issues
         """
         url = f"{base_url}{file.url}"
-        self.logger.debug(f"Starting file download: {url}")
+        self.logger.debug("Starting file download: %s", url)
+        ext = (
+            os.path.splitext(file.filename)[1]
+            if hasattr(file, "filename") and file.filename
+            else ""
+        )
+        self.logger.debug("File extension: %s", ext)
+
+        hasher = xxhash.xxh3_128()
+        size = 0
+        tmp = tempfile.SpooledTemporaryFile(
+            max_size=DOWNLOAD_SPOOL_SIZE, dir=self.cache_dir
+        )
         try:
-            response = requests.get(url, timeout=timeout)
-            if response.status_code != 200:
-                error_msg = f"File download failed: Status code {response.status_code}, Response: {response.text}"
-                self.logger.error(error_msg)
-                raise Exception(error_msg)
-            file_in_bytes = response.content
+            with _SESSION.get(url, timeout=timeout, stream=True) as response:
+                if response.status_code != 200:
+                    error_msg = f"File download failed: Status code {response.status_code}, Response: {response.text}"
+                    self.logger.error(error_msg)
+                    raise Exception(error_msg)
+                chunks = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+                writer = _WRITER_POOL.submit(_write_chunks, tmp, chunks)
+                try:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        chunks.put(chunk)
+                        size += len(chunk)
+                finally:
+                    chunks.put(None)
+                    writer.result()
         except requests.RequestException as e:
+            tmp.close()
             self.logger.exception(
                 "Requests client error occurred during file download."
             )
             raise Exception(f"Error during file download: {str(e)}")
         except Exception as e:
+            tmp.close()
             self.logger.exception("Unexpected error occurred during file download.")
             raise Exception(f"Error during file download: {str(e)}")
 
-        self.logger.info(f"Downloaded file size: {len(file_in_bytes)} bytes")
-        ext = (
-            os.path.splitext(file.filename)[1]
-            if hasattr(file, "filename") and file.filename
-            else ""
-        )
-        self.logger.debug(f"File extension: {ext}")
-        return file_in_bytes, ext
+        file_hash = f"{FILE_HASH_PREFIX}{hasher.hexdigest()}"
+        self.logger.info("Downloaded file size: %s bytes", size)
+        tmp.seek(0)
+        return tmp, file_hash, ext
+
+    def _persist_download(self, content, path: str) -> None:
+        """
+        Write downloaded content to its place in the cache directory.
+
+        The content is copied to a temporary file next to the target and renamed into
+        place, so concurrent invocations never see a partial file. An existing file is
+        kept as-is: the name is derived from the content hash, so it already holds the
+        same bytes.
+
+        Args:
+            content: Readable binary file object positioned at the start of the content
+            path (str): Destination path in the cache directory
+        """
+        if os.path.exists(path):
+            return
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, suffix=".part", delete=False
+        ) as out:
+            try:
+                shutil.copyfileobj(content, out, DOWNLOAD_CHUNK_SIZE)
+            except BaseException:
+                out.close()
+                os.unlink(out.name)
+                raise
+        os.replace(out.name, path)
 
     def _return_result(
         self,
-        result: str,
+        result_bytes: bytes,
         return_type: str,
         as_file: bool,
         original_filename: str = "output",
@@ -173,7 +456,7 @@ class UpstageDocumentparseTool(Tool):
         Return the processing result in the appropriate format.
 
         Args:
-            result (str): The conversion result as a string
+            result_bytes (bytes): The conversion result as UTF-8 encoded bytes
             return_type (str): The format of the result (md, html, or text)
             as_file (bool): Whether to return as a file (True) or as text (False)
             original_filename (str, optional): The original filename to use as a base. Defaults to "output".
@@ -182,7 +465,10 @@ class UpstageDocumentparseTool(Tool):
             ToolInvokeMessage: A message containing the result, either as a blob or text
         """
         self.logger.info(
-            f"Starting result return: type={return_type}, file_format={as_file}, original_filename={original_filename}"
+            "Starting result return: type=%s, file_format=%s, original_filename=%s",
+            return_type,
+            as_file,
+            original_filename,
         )
 
         # Extract base filename without extension from original filename
@@ -192,44 +478,112 @@ class UpstageDocumentparseTool(Tool):
             base_filename = "output"
 
         if as_file:
-            if return_type == "md":
-                result_bytes = result.encode("utf-8")
-                output_filename = f"{base_filename}.md"
-                self.logger.debug(
-                    f"Returning result as markdown file: {output_filename}"
-                )
-                yield self.create_blob_message(
-                    result_bytes,
-                    meta={
-                        "filename": output_filename,
-                        "mime_type": "text/markdown",
-                    },
-                )
-            elif return_type == "html":
-                result_bytes = result.encode("utf-8")
-                output_filename = f"{base_filename}.html"
-                self.logger.debug(f"Returning result as HTML file: {output_filename}")
-                yield self.create_blob_message(
-                    result_bytes,
-                    meta={
-                        "filename": output_filename,
-                        "mime_type": "text/html",
-                    },
-                )
-            elif return_type == "text":
-                result_bytes = result.encode("utf-8")
-                output_filename = f"{base_filename}.txt"
-                self.logger.debug(f"Returning result as text file: {output_filename}")
-                yield self.create_blob_message(
-                    result_bytes,
-                    meta={
-                        "filename": output_filename,
-                        "mime_type": "text/plain",
-                    },
-                )
+            if return_type not in RESULT_FILE_TYPES:
+                return
+            ext, mime_type = RESULT_FILE_TYPES[return_type]
+            output_filename = f"{base_filename}.{ext}"
+            self.logger.debug(
+                "Returning result as %s file: %s", mime_type, output_filename
+            )
+            yield self.create_blob_message(
+                result_bytes,
+                meta={
+                    "filename": output_filename,
+                    "mime_type": mime_type,
+                },
+            )
         else:
             self.logger.debug("Returning result as text message")
-            yield self.create_text_message(result)
+            yield self.create_text_message(result_bytes.decode("utf-8"))
+
+    def _process_file(
+        self,
+        client: UpstageDocumentParseClient,
+        file_obj,
+        base_url: str,
+        result_type: str,
+    ) -> Tuple[bytes, str]:
+        """
+        Download a single file and convert it, using the result cache when possible.
+
+        Args:
+            client (UpstageDocumentParseClient): The client used for conversion
+            file_obj: The file object containing URL and filename
+            base_url (str): The base URL to prepend to the file URL
+            result_type (str): Output format (md, html, or text)
+
+        Returns:
+            Tuple[bytes, str]: The UTF-8 encoded result and the original filename
+
+        Raises:
+            Exception: If downloading or converting the file fails
+        """
+        download = None
+        try:
+            # Download file: spool it while computing its hash
+            self.logger.info("Starting file download")
+            download, file_hash, ext = self._download_and_hash(file_obj, base_url)
+            self.logger.info("File info: %s", file_obj)
+
+            filename = file_obj.filename
+            self.logger.info("File name: %s", filename)
+
+            # Create cache key - using file hash and result type. The as_file flag
+            # only affects how the result is returned, not the converted content.
+            cache_key = f"{file_hash}_{result_type}"
+
+            # Cache result file path
+            result_cache_path = self._get_cache_filepath(file_hash, result_type)
+
+            # Check cache
+            if cache_key in self.conversion_cache:
+                # Stat and read directly instead of probing with os.path.exists first
+                try:
+                    cached_result = _read_cached(
+                        result_cache_path, os.stat(result_cache_path).st_mtime_ns
+                    )
+                except FileNotFoundError:
+                    cached_result = None
+                    self.logger.info("Cached result file missing: %s", cache_key)
+                except Exception as e:
+                    cached_result = None
+                    self.logger.warning(
+                        "Failed to read cache file, converting again: %s", e
+                    )
+                # Continue processing if the cache cannot be used
+                if cached_result is not None:
+                    self.logger.info("Returning result from cache: %s", cache_key)
+                    return cached_result, filename
+
+            # Cache miss: persist the downloaded file to the cache for conversion
+            original_cache_path = os.path.join(self.cache_dir, f"{file_hash}{ext}")
+            self._persist_download(download, original_cache_path)
+            self.logger.debug("Original file saved to cache: %s", original_cache_path)
+
+            self.logger.info("Starting conversion to %s format", result_type)
+            # The client hands back UTF-8 bytes, which are cached and returned as-is
+            result_bytes = client.convert_to_bytes(
+                original_cache_path, CONVERTERS[result_type]
+            )
+            if result_bytes is None:
+                raise Exception(f"Conversion to {result_type} format failed")
+
+            # Save conversion result to file-based cache
+            try:
+                with open(result_cache_path, "wb") as f:
+                    f.write(result_bytes)
+                # Update cache index
+                self._append_cache_entry(cache_key)
+                self.logger.info("Conversion result saved to cache: %s", cache_key)
+            except Exception as e:
+                self.logger.error("Cache save failed: %s", e)
+
+            self.logger.info("Conversion complete, returning result")
+            return result_bytes, filename
+        finally:
+            # Release the spooled download (memory or anonymous temporary file)
+            if download is not None:
+                download.close()
 
     def _invoke(
         self, tool_parameters: dict[str, Any]
@@ -242,7 +596,7 @@ class UpstageDocumentparseTool(Tool):
 
         Args:
             tool_parameters (dict[str, Any]): Parameters for the tool invocation, including:
-                - files: List of file objects to process (only the first one is used)
+                - files: List of file objects to process
                 - result_type: Output format (md, html, or text)
                 - as_file: Whether to return as file ("file") or text ("text")
 
@@ -276,7 +630,7 @@ class UpstageDocumentparseTool(Tool):
               (e.g., tables or figures) from the document. Default: [].
         """
         self.logger.info("Tool invocation started")
-        self.logger.debug(f"Tool parameters: {tool_parameters}")
+        self.logger.debug("Tool parameters: %s", tool_parameters)
 
         files = tool_parameters.get("files", [])
         if not files:
@@ -284,13 +638,20 @@ class UpstageDocumentparseTool(Tool):
             yield self.create_text_message("No files provided.")
             return
 
-        # Process only the first file
-        file_obj = files[0]
-        self.logger.info(f"File to process: {getattr(file_obj, 'filename', 'unknown')}")
+        self.logger.info(
+            "Files to process: %s",
+            [getattr(file_obj, "filename", "unknown") for file_obj in files],
+        )
         result_type = tool_parameters.get("result_type", "md")
         as_file = tool_parameters.get("as_file", "text")
         as_file = as_file == "file"
-        self.logger.debug(f"Result type: {result_type}, File format: {as_file}")
+        self.logger.debug("Result type: %s, File format: %s", result_type, as_file)
+
+        if result_type not in CONVERTERS:
+            error_msg = f"Unsupported result type: {result_type}"
+            self.logger.error(error_msg)
+            yield self.create_text_message(error_msg)
+            return
 
         base_url = self.runtime.credentials.get("base_url", "https://cloud.dify.ai")
         api_key = self.runtime.credentials.get("upstage_api_key")
@@ -299,89 +660,37 @@ class UpstageDocumentparseTool(Tool):
             yield self.create_text_message("Missing upstage_api_key in credentials.")
             return
 
-        # Initialize client
-        if self.client is None:
-            self.logger.info("Initializing Upstage client")
-            self.client = UpstageDocumentParseClient(
-                api_key=api_key,
-                debug=self.debug,
-                output_dir=self.output_dir,
-                model=self.model,
-            )
-
-        try:
-            # Download file: get file content and extension
-            self.logger.info("Starting file download")
-            file_content, ext = self._download_file(file_obj, base_url)
-            self.logger.info(f"File info: {file_obj}")
-
-            filename = file_obj.filename
-            self.logger.info(f"File name: {filename}")
-
-            # Calculate file hash (used as cache key)
-            file_hash = hashlib.md5(file_content).hexdigest()
+        client = self._get_client(api_key)
 
-            # Create cache key - using file hash, result type, and output format
-            cache_key = f"{file_hash}_{result_type}_{as_file}"
+        # Load the cache index on first use; this also creates the cache directory
+        self.conversion_cache
 
-            # Save original file to cache (if needed)
-            original_cache_path = os.path.join(self.cache_dir, f"{file_hash}{ext}")
-            if not os.path.exists(original_cache_path):
-                with open(original_cache_path, "wb") as f:
-                    f.write(file_content)
-                self.logger.debug(
-                    f"Original file saved to cache: {original_cache_path}"
+        # Documents are processed concurrently; each spends most of its time waiting
+        # on the network, so their downloads, submissions and polls overlap.
+        # Results are returned in the order the files were given.
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_FILES, len(files))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._process_file, client, file_obj, base_url, result_type
                 )
-
-            # Cache result file path
-            result_cache_path = self._get_cache_filepath(file_hash, result_type)
-
-            # Check cache
-            if cache_key in self.conversion_cache and os.path.exists(result_cache_path):
-                self.logger.info(f"Returning result from cache: {cache_key}")
+                for file_obj in files
+            ]
+            for future in futures:
                 try:
-                    with open(result_cache_path, "r", encoding="utf-8") as f:
-                        cached_result = f.read()
-                    yield from self._return_result(
-                        cached_result, result_type, as_file, filename
-                    )
-                    return
+                    result_bytes, filename = future.result()
                 except Exception as e:
-                    self.logger.warning(
-                        f"Failed to read cache file, converting again: {e}"
+                    self.logger.exception(
+                        "Error occurred during file processing: %s", e
                     )
-                    # Continue processing if cache fails
-
-            self.logger.info(f"Starting conversion to {result_type} format")
-            if result_type == "md":
-                results = self.client.convert_to_markdown(original_cache_path)
-            elif result_type == "html":
-                results = self.client.convert_to_html(original_cache_path)
-            elif result_type == "text":
-                results = self.client.convert_to_text(original_cache_path)
-            else:
-                error_msg = f"Unsupported result type: {result_type}"
-                self.logger.error(error_msg)
-                yield self.create_text_message(error_msg)
-                return
-
-            # Save conversion result to file-based cache
-            try:
-                with open(result_cache_path, "w", encoding="utf-8") as f:
-                    f.write(results)
-                # Update cache index
-                self.conversion_cache[cache_key] = True
-                self._save_cache_index()
-                self.logger.info(f"Conversion result saved to cache: {cache_key}")
-            except Exception as e:
-                self.logger.error(f"Cache save failed: {e}")
-
-            self.logger.info("Conversion complete, returning result")
-            yield from self._return_result(
-                results, result_type, as_file=as_file, original_filename=filename
-            )
-        except Exception as e:
-            self.logger.exception(f"Error occurred during file processing: {e}")
-            yield self.create_text_message(
-                f"Error occurred during file processing: {str(e)}"
-            )
+                    yield self.create_text_message(
+                        f"Error occurred during file processing: {str(e)}"
+                    )
+                    continue
+                yield from self._return_result(
+                    result_bytes,
+                    result_type,
+                    as_file=as_file,
+                    original_filename=filename,
+                )
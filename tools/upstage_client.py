@@ -1,13 +1,372 @@
+import io
 import os
+import asyncio
 import time
 import json
 import logging
 import hashlib
+import heapq
+import mmap
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Deque, Mapping, Union
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import blake3
+
+    _new_hasher = blake3.blake3
+    # Prefix marking BLAKE3 file digests, keeping them apart from SHA-256 cache keys
+    FILE_HASH_PREFIX = "b3_"
+except ImportError:
+    _new_hasher = hashlib.sha256
+    FILE_HASH_PREFIX = ""
+
+try:
+    import orjson
+
+    def _json_dumps_str(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps_str(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _json_loads = json.loads
+
+# Files at least this large are hashed through a read-only memory map
+MMAP_THRESHOLD = 10 * 1024 * 1024
+# Read size used when hashing smaller files
+HASH_CHUNK_SIZE = 1024 * 1024
+# Files up to this size are read once into memory by request(), for both hashing
+# and the POST body; larger files are hashed and uploaded in two passes
+UPLOAD_BUFFER_MAX = 4 * 1024 * 1024
+# Number of (path, mtime, size) -> digest entries remembered per client
+FILE_HASH_CACHE_SIZE = 128
+# Status polling backoff: delay = min(poll_interval, POLL_BACKOFF_MIN * POLL_BACKOFF_BASE**attempt)
+POLL_BACKOFF_BASE = 1.3
+POLL_BACKOFF_MIN = 0.05
+# Adaptive polling: once this many batch completion times have been observed, polls
+# are placed at POLL_SCHEDULE_POINTS quantiles (up to the 99th) of the expected time
+POLL_SCHEDULE_MIN_SAMPLES = 5
+POLL_SCHEDULE_POINTS = 10
+COMPLETION_HISTORY_SIZE = 200
+# Upper bound in seconds for the doubling delay after a failed status poll
+POLL_ERROR_BACKOFF_MAX = 60
+# Number of batch results downloaded in parallel
+DOWNLOAD_WORKERS = 8
+# Number of documents processed concurrently by process_documents()
+DOCUMENT_WORKERS = 8
+# Timeout in seconds for requests made by the asynchronous API
+ASYNC_TIMEOUT = 60
+# Requests per second and in-flight requests allowed by wait_and_download()
+ASYNC_RATE_LIMIT = 5
+ASYNC_CONCURRENCY = 3
+# Read size used when streaming batch results to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Maximum number of entries kept by each in-memory cache of the client
+CACHE_MAX_ENTRIES = 1024
+# Number of oldest cache entries checked for expiry on every insert
+CACHE_PRUNE_SCAN = 8
+# Processed-document results kept in memory; the SQLite store holds the rest
+RESULT_CACHE_SIZE = 256
+# Converted documents kept in memory by convert_to_bytes(); entries can be large
+RENDER_CACHE_SIZE = 32
+# File in output_dir that persists the result and request-id caches across processes
+CACHE_DB_NAME = ".upstage_cache.sqlite"
+# Output file extension per export format; other formats use their own name
+EXPORT_EXTENSIONS = {"markdown": "md", "html": "html", "text": "txt"}
+
+
+def _hash_path(path: str) -> str:
+    """
+    Compute the content digest of a file on disk.
+
+    BLAKE3 is used when available (SIMD-accelerated and much faster than SHA-256;
+    the digest is only a cache key), falling back to SHA-256. Files of
+    MMAP_THRESHOLD bytes or more are memory-mapped and hashed in a single call,
+    letting the kernel page data straight into the hash function. Smaller files
+    are read in HASH_CHUNK_SIZE chunks.
+
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        str: The hex digest of the file content, prefixed with FILE_HASH_PREFIX
+    """
+    hasher = _new_hasher()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+    return FILE_HASH_PREFIX + hasher.hexdigest()
+
+
+class _RateLimiter:
+    """Asyncio limiter spacing calls evenly so at most `rate` start per `period`."""
+
+    def __init__(self, rate: float, period: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate (float): Number of calls allowed per period
+            period (float): Length of the period in seconds. Defaults to 1.0.
+        """
+        self.interval = period / rate
+        self._next_slot = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Wait until the next call slot is free."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class _ThrottledTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport wrapper that rate-limits requests and caps how many are in flight.
+
+    Response bodies are read before a slot is released, so responses are always
+    fully buffered, even for streamed requests.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: _RateLimiter,
+        concurrency: int,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): Transport that sends the requests
+            limiter (_RateLimiter): Limiter every request waits on before it is sent
+            concurrency (int): Maximum number of requests in flight
+        """
+        self._transport = transport
+        self._limiter = limiter
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._semaphore:
+            await self._limiter.acquire()
+            response = await self._transport.handle_async_request(request)
+            # Read the body while holding the slot; otherwise httpx reads it after
+            # this returns and large downloads would escape the concurrency cap
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _LruTtl:
+    """Thread-safe, size-bounded LRU mapping whose entries expire after a TTL."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None, admit_after: int = 1):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries; the least recently used is evicted
+            ttl (Optional[float]): Seconds an entry stays valid. None disables expiry.
+            admit_after (int): Number of set() calls for a key before it is actually
+                stored, so one-off keys do not take slots. Defaults to 1 (always store).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.admit_after = admit_after
+        self._data: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+        # Keys seen by set() but not admitted yet, with how often they were set
+        self._weights: "OrderedDict[Any, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _expired(self, timestamp: float, now: float) -> bool:
+        return self.ttl is not None and now - timestamp >= self.ttl
+
+    def check(self, key: Any) -> Optional[Any]:
+        """
+        Return the value for key if present and not expired.
+
+        Args:
+            key (Any): Cache key
+
+        Returns:
+            Optional[Any]: The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry[1], time.time()):
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Any, value: Any, timestamp: Optional[float] = None) -> None:
+        """
+        Store a value, evicting expired and least recently used entries.
+
+        With admit_after > 1, a new key is only stored once it has been set that
+        many times; earlier calls just count towards its weight.
+
+        Args:
+            key (Any): Cache key
+            value (Any): Value to store
+            timestamp (Optional[float]): When the value was produced. Defaults to now.
+        """
+        now = time.time()
+        with self._lock:
+            if self.admit_after > 1 and key not in self._data:
+                weight = self._weights.pop(key, 0) + 1
+                if weight < self.admit_after:
+                    self._weights[key] = weight
+                    if len(self._weights) > self.maxsize:
+                        self._weights.popitem(last=False)
+                    return
+            self._data[key] = (value, now if timestamp is None else timestamp)
+            self._data.move_to_end(key)
+            # Entries are kept in recency order, so expired ones gather at the front
+            # Collect the keys first; the dict cannot change while islice iterates it
+            for old_key in list(islice(self._data, CACHE_PRUNE_SCAN)):
+                if self._expired(self._data[old_key][1], now):
+                    del self._data[old_key]
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def evict(self, key: Any) -> None:
+        """
+        Remove key if present.
+
+        Args:
+            key (Any): Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._weights.pop(key, None)
+
+
+def create_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Create a keep-alive requests session with a pooled, retrying adapter.
+
+    Every HTTP session in the plugin is built here, so all of them reuse warm
+    connections and retry throttling and server errors the same way. Once the retries
+    are exhausted the last response is returned as-is, leaving status handling to
+    the caller.
+
+    Args:
+        headers (Optional[Dict[str, str]]): Extra headers sent with every request
+
+    Returns:
+        requests.Session: The configured session
+    """
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={"GET", "POST"},
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _RewindableMultipart:
+    """
+    Streaming multipart/form-data body that can be replayed on retry.
+
+    MultipartEncoder reads file parts lazily, so a document is sent to the socket
+    chunk by chunk instead of being assembled in memory first. It cannot seek,
+    though, and urllib3 rewinds request bodies before retrying a POST; this
+    wrapper rebuilds the encoder (after rewinding the file parts) on seek(0).
+    """
+
+    def __init__(self, fields: Dict[str, Any]):
+        """
+        Initialize the body.
+
+        Args:
+            fields (Dict[str, Any]): Form fields. Tuple values are file parts whose
+                second item is a seekable file-like object; other values are sent
+                as their string form.
+        """
+        self._fields = {
+            name: value if isinstance(value, tuple) else str(value)
+            for name, value in fields.items()
+        }
+        self._encoder = MultipartEncoder(self._fields)
+        self.content_type = self._encoder.content_type
+        self.len = self._encoder.len
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes of the encoded body (all remaining if -1)."""
+        chunk = self._encoder.read(size)
+        self._position += len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        """Return the number of body bytes read so far."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> None:
+        if (offset, whence) != (0, io.SEEK_SET):
+            raise io.UnsupportedOperation("Multipart body can only be rewound")
+        # Rebuild from the start; the boundary must match the Content-Type already sent
+        for value in self._fields.values():
+            if isinstance(value, tuple):
+                value[1].seek(0)
+        self._encoder = MultipartEncoder(
+            self._fields, boundary=self._encoder.boundary_value
+        )
+        self._position = 0
 
 
 @dataclass
@@ -73,7 +432,7 @@ class UpstageDocumentParseClient:
                 "No API key provided. Either pass it directly or set the UPSTAGE_API_KEY environment variable."
             )
 
-        self.base_url = base_url.rstrip("/")
+        self.base_url = base_url
         self.ocr = ocr
         self.coordinates = coordinates
         self.output_formats = output_formats or ["html", "markdown", "text"]
@@ -85,9 +444,33 @@ class UpstageDocumentParseClient:
         self.request_id: Optional[str] = None
         self.batch_results: List[BatchResult] = []
 
+        # Form fields sent with every request; list options are encoded as JSON arrays
+        self._request_form = {
+            "ocr": self.ocr,
+            "coordinates": self.coordinates,
+            "output_formats": json.dumps(self.output_formats),
+            "chart_recognition": self.chart_recognition,
+            "base64_encoding": json.dumps(self.base64_encoding),
+            "model": self.model,
+        }
+
+        # Persisted cache keys are scoped to the API key, endpoint and request
+        # options, so clients sharing the cache file never reuse each other's
+        # jobs (a request ID is only valid for the key that submitted it) or
+        # results produced with different options
+        self._cache_scope = hashlib.sha256(
+            json.dumps(
+                [
+                    hashlib.sha256(self.api_key.encode("utf-8")).hexdigest(),
+                    self.base_url,
+                    self._request_form,
+                ],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()[:32]
+
         # Create reusable HTTP session
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+        self.session = create_session({"Authorization": f"Bearer {self.api_key}"})
 
         # Configure logging
         self.logger = logging.getLogger("upstage_client")
@@ -106,21 +489,153 @@ class UpstageDocumentParseClient:
             self.logger.debug("Debug mode activated.")
 
         # Instance variables for caching (TTL: 3600 seconds, i.e., 1 hour)
-        self._cache: Dict[str, (Dict[str, str], float)] = {}
         self._cache_ttl: int = 3600
+        # Results are admitted on their second use: a fresh result is only written
+        # to the SQLite store, and moves into memory once it is requested again
+        self._cache = _LruTtl(RESULT_CACHE_SIZE, self._cache_ttl, admit_after=2)
 
         # Cache to reduce API request calls for identical files (file content hash -> request_id)
-        self._request_id_cache: Dict[str, str] = {}
+        self._request_id_cache = _LruTtl(CACHE_MAX_ENTRIES, self._cache_ttl)
+
+        # File digests memoized by (absolute path, mtime_ns, size), so unchanged files
+        # are not re-read just to compute a cache key (LRU, FILE_HASH_CACHE_SIZE entries)
+        self._file_hash_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._file_hash_lock = threading.Lock()
+
+        # (absolute path, mtime_ns, size, export formats) -> result cache key
+        self._stat_to_cachekey = _LruTtl(CACHE_MAX_ENTRIES)
+
+        # Result cache key of a single format -> converted content (UTF-8 bytes)
+        self._render_cache = _LruTtl(RENDER_CACHE_SIZE, self._cache_ttl)
+
+        # URL -> (conditional request headers, parsed body) of the last JSON response
+        # that carried an ETag or Last-Modified, so unchanged resources cost a 304
+        self._etags = _LruTtl(CACHE_MAX_ENTRIES)
+
+        # Observed (page count, seconds to complete) per batch, used to place polls
+        self._completion_history: Deque[Tuple[int, float]] = deque(
+            maxlen=COMPLETION_HISTORY_SIZE
+        )
+
+        # Both caches above are backed by a SQLite file in output_dir, so a fresh
+        # client (e.g. after a plugin restart) still finds earlier results
+        self._kv_lock = threading.Lock()
+        self._kv = self._open_kv_store()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the API, without a trailing slash."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        # Endpoint URLs are built once here rather than on every request or poll
+        self._base_url = value.rstrip("/")
+        self._parse_url = f"{self._base_url}/async/document-parse"
+        self._status_url = f"{self._base_url}/requests/%s"
+        self._list_url = f"{self._base_url}/requests"
+
+    def _open_kv_store(self) -> Optional[sqlite3.Connection]:
+        """
+        Open (creating if needed) the persistent cache database in output_dir.
+
+        Returns:
+            Optional[sqlite3.Connection]: The connection, or None if the database
+                cannot be opened, in which case only the in-memory caches are used
+        """
+        try:
+            Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+            kv = sqlite3.connect(
+                str(Path(self.output_dir) / CACHE_DB_NAME),
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            kv.execute(
+                "CREATE TABLE IF NOT EXISTS entries("
+                "key TEXT PRIMARY KEY, request_id TEXT, exported_json TEXT, ts REAL)"
+            )
+            return kv
+        except sqlite3.Error as e:
+            self.logger.warning("Persistent cache disabled: %s", e)
+            return None
+
+    def _kv_get(self, key: str) -> Optional[Tuple[Optional[str], Optional[str], float]]:
+        """
+        Read an entry from the persistent cache.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[Tuple[Optional[str], Optional[str], float]]: (request_id,
+                exported_json, timestamp), or None if absent or the store is unavailable
+        """
+        if self._kv is None:
+            return None
+        try:
+            with self._kv_lock:
+                return self._kv.execute(
+                    "SELECT request_id, exported_json, ts FROM entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to read persistent cache: %s", e)
+            return None
+
+    def _kv_put(
+        self,
+        key: str,
+        request_id: Optional[str] = None,
+        exported_json: Optional[str] = None,
+    ) -> None:
+        """
+        Write an entry to the persistent cache, replacing any previous value.
+
+        Args:
+            key (str): Cache key
+            request_id (Optional[str]): Request ID to store
+            exported_json (Optional[str]): JSON-encoded exported file mapping to store
+        """
+        if self._kv is None:
+            return
+        try:
+            with self._kv_lock:
+                self._kv.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (key, request_id, exported_json, time.time()),
+                )
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to write persistent cache: %s", e)
+
+    def _kv_delete(self, key: str) -> None:
+        """
+        Remove an entry from the persistent cache.
+
+        Args:
+            key (str): Cache key
+        """
+        if self._kv is None:
+            return
+        try:
+            with self._kv_lock:
+                self._kv.execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to update persistent cache: %s", e)
 
     def _generate_cache_key(
-        self, file_path: str, export_formats: Optional[List[str]]
+        self,
+        file_path: str,
+        export_formats: Optional[List[str]],
+        file_hash: Optional[str] = None,
     ) -> str:
         """
-        Generate a cache key based on file content and export formats.
+        Generate a cache key based on file content, export formats and the
+        client's cache scope (API key and request options).
 
         Args:
             file_path (str): Path to the file
             export_formats (Optional[List[str]]): List of export formats
+            file_hash (Optional[str]): Digest of the file content, if already known
 
         Returns:
             str: A unique cache key combining file hash and export formats
@@ -128,17 +643,8 @@ class UpstageDocumentParseClient:
         Raises:
             Exception: If file cannot be read
         """
-        try:
-            with open(file_path, "rb") as f:
-                content = f.read()
-        except Exception as e:
-            self.logger.error(
-                f"Error reading file while generating cache key ({file_path}): {e}"
-            )
-            raise
-
         # Calculate hash of file content
-        file_hash = hashlib.sha256(content).hexdigest()
+        file_hash = file_hash or self._hash_file(file_path)
 
         # Convert export_formats to a JSON string (sorted for consistency)
         export_formats_str = (
@@ -150,30 +656,124 @@ class UpstageDocumentParseClient:
             export_formats_str.encode("utf-8")
         ).hexdigest()
 
-        return f"{file_hash}_{export_formats_hash}"
+        return f"{self._cache_scope}_{file_hash}_{export_formats_hash}"
 
     def _generate_request_cache_key(self, file_path: str) -> str:
         """
-        Generate an API request cache key based only on file content.
+        Generate an API request cache key based on file content and the client's
+        cache scope (API key and request options).
+
+        Args:
+            file_path (str): Path to the file
+
+        Returns:
+            str: The cache scope combined with a hash of the file content
+
+        Raises:
+            Exception: If file cannot be read
+        """
+        return f"{self._cache_scope}_{self._hash_file(file_path)}"
+
+    def _hash_file(self, file_path: str) -> str:
+        """
+        Hash the content of a file, streaming it from disk.
+
+        This is the single implementation behind both cache-key helpers. The file is
+        never read into memory as a whole (see _hash_path), and digests are memoized
+        by (absolute path, mtime_ns, size) so an unchanged file is only hashed once.
+
+        Args:
+            file_path (str): Path to the file
+
+        Returns:
+            str: The digest of the file content (see _hash_path)
+
+        Raises:
+            Exception: If file cannot be read
+        """
+        try:
+            stat_key, digest = self._lookup_file_hash(file_path)
+            if digest is not None:
+                return digest
+            digest = _hash_path(file_path)
+        except Exception as e:
+            self.logger.error("Error reading file while hashing (%s): %s", file_path, e)
+            raise
+
+        self._remember_file_hash(stat_key, digest)
+        return digest
+
+    def _hash_and_buffer(self, file_path: str) -> Tuple[str, Optional[io.BytesIO]]:
+        """
+        Hash a file for upload, keeping its content in memory when that saves a read.
+
+        When the digest is not memoized and the file is at most UPLOAD_BUFFER_MAX
+        bytes, the file is read once and the same chunks feed both the hash and an
+        in-memory buffer that request() can POST directly.
 
         Args:
             file_path (str): Path to the file
 
         Returns:
-            str: A hash of the file content
+            Tuple[str, Optional[io.BytesIO]]: The file digest and a buffer holding
+                the file content, or None if the file was not buffered
 
         Raises:
             Exception: If file cannot be read
         """
         try:
+            stat_key, digest = self._lookup_file_hash(file_path)
+            if digest is not None or stat_key[2] > UPLOAD_BUFFER_MAX:
+                return digest or self._hash_file(file_path), None
+
+            hasher = _new_hasher()
+            buffer = io.BytesIO()
             with open(file_path, "rb") as f:
-                content = f.read()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    buffer.write(chunk)
+            digest = FILE_HASH_PREFIX + hasher.hexdigest()
         except Exception as e:
-            self.logger.error(
-                f"Error reading file while generating request cache key ({file_path}): {e}"
-            )
+            self.logger.error("Error reading file while hashing (%s): %s", file_path, e)
             raise
-        return hashlib.sha256(content).hexdigest()
+
+        self._remember_file_hash(stat_key, digest)
+        buffer.seek(0)
+        return digest, buffer
+
+    def _lookup_file_hash(
+        self, file_path: str
+    ) -> Tuple[Tuple[str, int, int], Optional[str]]:
+        """
+        Look up a memoized file digest.
+
+        Args:
+            file_path (str): Path to the file
+
+        Returns:
+            Tuple[Tuple[str, int, int], Optional[str]]: The (absolute path, mtime_ns,
+                size) memo key and the digest, or None if it is not memoized
+        """
+        st = os.stat(file_path)
+        stat_key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        with self._file_hash_lock:
+            digest = self._file_hash_cache.get(stat_key)
+            if digest is not None:
+                self._file_hash_cache.move_to_end(stat_key)
+        return stat_key, digest
+
+    def _remember_file_hash(self, stat_key: Tuple[str, int, int], digest: str) -> None:
+        """
+        Memoize a file digest, evicting the least recently used entry if full.
+
+        Args:
+            stat_key (Tuple[str, int, int]): (absolute path, mtime_ns, size) memo key
+            digest (str): The file digest
+        """
+        with self._file_hash_lock:
+            self._file_hash_cache[stat_key] = digest
+            if len(self._file_hash_cache) > FILE_HASH_CACHE_SIZE:
+                self._file_hash_cache.popitem(last=False)
 
     def request(
         self,
@@ -199,55 +799,114 @@ class UpstageDocumentParseClient:
             requests.RequestException: If the API request fails
             ValueError: If the API response is invalid
         """
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
+        if not Path(file_path).exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        # Hashing and uploading share a single read of the file where possible
+        file_hash, buffer = self._hash_and_buffer(file_path)
+        request_id, _ = self._submit(
+            file_path, file_hash, buffer, wait, poll_interval, max_wait
+        )
+        return request_id
+
+    def _submit(
+        self,
+        file_path: str,
+        file_hash: str,
+        buffer: Optional[io.BytesIO],
+        wait: bool = False,
+        poll_interval: int = 1,
+        max_wait: int = 300,
+    ) -> Tuple[str, Optional[List[BatchResult]]]:
+        """
+        Submit an already hashed document, reusing a previous request when possible.
+
+        A remembered request is checked with the status endpoint before it is
+        reused. If it has failed, is no longer known to the API (HTTP 4xx) or does
+        not complete within max_wait, it is forgotten and the file is submitted
+        again.
+
+        Args:
+            file_path (str): Path to the document file to process
+            file_hash (str): Digest of the file content
+            buffer (Optional[io.BytesIO]): File content already read into memory, or
+                None to read the file when uploading
+            wait (bool): Whether to wait for processing to complete. Defaults to False.
+            poll_interval (int): Number of seconds between status checks when waiting. Defaults to 1.
+            max_wait (int): Maximum number of seconds to wait for completion. Defaults to 300.
+
+        Returns:
+            Tuple[str, Optional[List[BatchResult]]]: The request ID assigned by the
+                API, and its batch results if they were checked
+
+        Raises:
+            requests.RequestException: If the API request fails
+            ValueError: If the API response is invalid or the request has failed
+            TimeoutError: If waiting times out
+        """
+        file_path_obj = Path(file_path)
         # Check cache for previously processed identical file
-        req_cache_key = self._generate_request_cache_key(file_path)
-        if req_cache_key in self._request_id_cache:
+        req_cache_key = f"{self._cache_scope}_{file_hash}"
+        request_id = self._request_id_cache.check(req_cache_key)
+        if request_id is None:
+            row = self._kv_get(req_cache_key)
+            if row and row[0] and time.time() - row[2] < self._cache_ttl:
+                request_id = row[0]
+                self._request_id_cache.set(req_cache_key, request_id, row[2])
+        if request_id is not None:
             self.logger.info(
                 "Found previous request for identical file. Using cached request_id."
             )
-            self.request_id = self._request_id_cache[req_cache_key]
-            if wait:
-                self.check_status(
-                    wait=True, poll_interval=poll_interval, max_wait=max_wait
+            try:
+                batch_results = self.check_status(
+                    request_id,
+                    wait=wait,
+                    poll_interval=poll_interval,
+                    max_wait=max_wait,
                 )
-            return self.request_id
-
-        url = f"{self.base_url}/async/document-parse"
-        self.logger.debug(f"API request URL: {url}")
-
-        with open(file_path, "rb") as f:
-            files = {"document": (file_path_obj.name, f)}
-            data = {
-                "ocr": self.ocr,
-                "coordinates": self.coordinates,
-                "output_formats": str(self.output_formats),
-                "chart_recognition": self.chart_recognition,
-                "base64_encoding": str(self.base64_encoding),
-                "model": self.model,
-            }
+            except (TimeoutError, ValueError, requests.HTTPError) as e:
+                if not self._is_stale_request_error(e):
+                    raise
+                self.logger.warning(
+                    "Cached request %s is not usable (%s). Resubmitting.",
+                    request_id,
+                    e,
+                )
+                self._request_id_cache.evict(req_cache_key)
+                self._kv_delete(req_cache_key)
+            else:
+                self.request_id = request_id
+                return request_id, batch_results
+
+        url = self._parse_url
+        self.logger.debug("API request URL: %s", url)
+
+        with buffer if buffer is not None else open(file_path, "rb") as f:
+            data = self._request_form
             self.logger.info(
-                f"Starting document parsing request for file '{file_path}'."
+                "Starting document parsing request for file '%s'.", file_path
             )
-            self.logger.debug(f"Request data: {data}")
+            self.logger.debug("Request data: %s", data)
+            body = _RewindableMultipart({**data, "document": (file_path_obj.name, f)})
 
             try:
-                response = self.session.post(url, files=files, data=data)
-                self.logger.debug(f"Response status code: {response.status_code}")
+                response = self.session.post(
+                    url, data=body, headers={"Content-Type": body.content_type}
+                )
+                self.logger.debug("Response status code: %s", response.status_code)
 
-                if self.debug:
+                if self.logger.isEnabledFor(logging.DEBUG):
                     try:
-                        self.logger.debug(f"Response content: {response.json()}")
+                        self.logger.debug("Response content: %s", response.json())
                     except Exception as e:
-                        self.logger.debug(f"JSON parsing failed: {e}")
-                        self.logger.debug(f"Response text: {response.text[:1000]}")
+                        self.logger.debug("JSON parsing failed: %s", e)
+                        self.logger.debug("Response text: %s", response.text[:1000])
 
                 if response.status_code not in (200, 202):
                     self.logger.error(
-                        f"API request failed: {response.status_code} - {response.text}"
+                        "API request failed: %s - %s",
+                        response.status_code,
+                        response.text,
                     )
                     response.raise_for_status()
 
@@ -257,24 +916,38 @@ class UpstageDocumentParseClient:
                         f"API response missing request_id: {response_data}"
                     )
 
-                self.request_id = response_data["request_id"]
+                request_id = response_data["request_id"]
+                self.request_id = request_id
                 self.logger.info(
-                    f"Document parsing request successfully submitted. Request ID: {self.request_id}"
+                    "Document parsing request successfully submitted. Request ID: %s",
+                    request_id,
                 )
 
                 # Cache the request_id for this file
-                self._request_id_cache[req_cache_key] = self.request_id
+                self._request_id_cache.set(req_cache_key, request_id)
+                self._kv_put(req_cache_key, request_id=request_id)
 
-                if wait:
-                    self.logger.info("Waiting for document processing to complete...")
-                    self.check_status(
-                        wait=True, poll_interval=poll_interval, max_wait=max_wait
-                    )
+                if not wait:
+                    return request_id, None
 
-                return self.request_id
+                self.logger.info("Waiting for document processing to complete...")
+                try:
+                    batch_results = self.check_status(
+                        request_id,
+                        wait=True,
+                        poll_interval=poll_interval,
+                        max_wait=max_wait,
+                    )
+                except (TimeoutError, ValueError, requests.HTTPError) as e:
+                    # Do not hand a request that never completed to the next caller
+                    if self._is_stale_request_error(e):
+                        self._request_id_cache.evict(req_cache_key)
+                        self._kv_delete(req_cache_key)
+                    raise
+                return request_id, batch_results
 
             except requests.RequestException as e:
-                self.logger.error(f"Error during API request: {e}")
+                self.logger.error("Error during API request: %s", e)
                 raise
 
     def check_status(
@@ -290,14 +963,16 @@ class UpstageDocumentParseClient:
         Args:
             request_id (Optional[str]): The request ID to check. If None, uses the last request_id.
             wait (bool): Whether to wait for processing to complete. Defaults to False.
-            poll_interval (int): Number of seconds between status checks when waiting. Defaults to 1.
+            poll_interval (int): Upper bound in seconds on the delay between status checks when
+                waiting. Checks start at POLL_BACKOFF_MIN and back off exponentially. Defaults to 1.
             max_wait (int): Maximum number of seconds to wait for completion. Defaults to 300.
 
         Returns:
             List[BatchResult]: A list of batch processing results
 
         Raises:
-            ValueError: If no request ID is available
+            ValueError: If no request ID is available, or the request or one of its
+                batches has failed
             requests.RequestException: If the API request fails
             TimeoutError: If waiting times out
         """
@@ -307,29 +982,16 @@ class UpstageDocumentParseClient:
                 "No request ID available. Call request() first or provide a request ID."
             )
 
-        url = f"{self.base_url}/requests/{request_id}"
-        self.logger.debug(f"Status check URL: {url}")
+        url = self._status_url % request_id
+        self.logger.debug("Status check URL: %s", url)
 
         start_time = time.time()
         try:
-            response = self.session.get(url)
-            self.logger.debug(f"Status check response code: {response.status_code}")
-
-            if self.debug:
-                try:
-                    self.logger.debug(f"Status check response: {response.json()}")
-                except Exception as e:
-                    self.logger.debug(f"JSON parsing failed: {e}")
-                    self.logger.debug(f"Response text: {response.text[:1000]}")
-
-            if response.status_code != 200:
-                self.logger.error(
-                    f"Status check failed: {response.status_code} - {response.text}"
-                )
-                response.raise_for_status()
-
-            response_data = response.json()
+            response_data, _ = self._get_json(url)
+            self.logger.debug("Status check response: %s", response_data)
 
+            attempt = 0
+            error_delay = 0
             while wait and response_data.get("status") == "submitted":
                 elapsed = time.time() - start_time
                 if elapsed > max_wait:
@@ -339,37 +1001,36 @@ class UpstageDocumentParseClient:
                 self.logger.info(
                     "Request submitted but processing has not started yet. Waiting..."
                 )
-                time.sleep(poll_interval)
-                response = self.session.get(url)
-                response.raise_for_status()
-                response_data = response.json()
+                time.sleep(self._poll_delay(attempt, poll_interval))
+                attempt += 1
+                try:
+                    data, modified = self._get_json(url)
+                except requests.RequestException as e:
+                    if not self._is_transient_error(e):
+                        raise
+                    error_delay = min(POLL_ERROR_BACKOFF_MAX, error_delay * 2 or 1)
+                    self.logger.warning(
+                        "Status poll failed (%s). Retrying in %s seconds...",
+                        e,
+                        error_delay,
+                    )
+                    time.sleep(error_delay)
+                    continue
+                error_delay = 0
+                if not modified:
+                    continue
+                response_data = data
                 self.logger.debug(
-                    f"Current request status: {response_data.get('status')}"
-                )
-
-            if "batches" not in response_data:
-                raise ValueError(
-                    f"API response missing batch information: {response_data}"
+                    "Current request status: %s", response_data.get("status")
                 )
 
-            self.batch_results = []
-            for batch in response_data["batches"]:
-                result = BatchResult(
-                    id=batch["id"],
-                    status=batch["status"],
-                    start_page=batch.get("start_page"),
-                    end_page=batch.get("end_page"),
-                    download_url=batch.get("download_url"),
-                )
-                if result.status == "completed":
-                    self.logger.info(
-                        f"Batch {result.id} completed: Pages {result.start_page}-{result.end_page}"
-                    )
-                    self.logger.debug(f"Download URL: {result.download_url}")
-                self.batch_results.append(result)
+            self._raise_if_failed(request_id, response_data)
+            batch_results = self._parse_batches(response_data)
+            batch_by_id = {result.id: result for result in batch_results}
+            schedule = self._poll_schedule(batch_results)
 
             while wait and not all(
-                result.status == "completed" for result in self.batch_results
+                result.status == "completed" for result in batch_results
             ):
                 elapsed = time.time() - start_time
                 if elapsed > max_wait:
@@ -377,82 +1038,743 @@ class UpstageDocumentParseClient:
                         "Not all batches have completed processing. Maximum wait time exceeded."
                     )
                 incomplete_count = sum(
-                    1 for result in self.batch_results if result.status != "completed"
+                    1 for result in batch_results if result.status != "completed"
                 )
+                delay = self._next_poll_delay(schedule, elapsed, attempt, poll_interval)
                 self.logger.info(
-                    f"{incomplete_count} batches still processing. Checking again in {poll_interval} seconds..."
+                    "%s batches still processing. Checking again in %.2f seconds...",
+                    incomplete_count,
+                    delay,
                 )
-                time.sleep(poll_interval)
-                response = self.session.get(url)
-                response.raise_for_status()
-                updated_batches = response.json().get("batches", [])
-                for updated_batch in updated_batches:
-                    for result in self.batch_results:
-                        if result.id == updated_batch["id"]:
-                            previous_status = result.status
-                            result.status = updated_batch["status"]
-                            if previous_status != result.status:
-                                self.logger.debug(
-                                    f"Batch {result.id} status changed: {previous_status} -> {result.status}"
-                                )
-                            if (
-                                result.status == "completed"
-                                and "download_url" in updated_batch
-                            ):
-                                result.download_url = updated_batch["download_url"]
-                                self.logger.info(
-                                    f"Batch {result.id} completed: Pages {updated_batch.get('start_page')}-{updated_batch.get('end_page')}"
-                                )
-                                self.logger.debug(
-                                    f"Download URL: {result.download_url}"
-                                )
+                time.sleep(delay)
+                attempt += 1
+                try:
+                    data, modified = self._get_json(url)
+                except requests.RequestException as e:
+                    if not self._is_transient_error(e):
+                        raise
+                    error_delay = min(POLL_ERROR_BACKOFF_MAX, error_delay * 2 or 1)
+                    self.logger.warning(
+                        "Status poll failed (%s). Retrying in %s seconds...",
+                        e,
+                        error_delay,
+                    )
+                    time.sleep(error_delay)
+                    continue
+                error_delay = 0
+                if not modified:
+                    continue
+                self._raise_if_failed(request_id, data)
+                updated_batches = data.get("batches", [])
+                if self._apply_batch_updates(
+                    batch_by_id, updated_batches, time.time() - start_time
+                ):
+                    # Restart the schedule so the remaining batches are
+                    # picked up quickly rather than at the longest delay
+                    attempt = 0
             self.logger.info("All batches have completed processing.")
 
-            # Filter batches to remove duplicates
-            # If multiple batches have the same (start_page, end_page),
-            # keep only the one with the highest batch ID
-            unique_batches = {}
-            for batch in self.batch_results:
-                key = (batch.start_page, batch.end_page)
-                if key in unique_batches:
-                    if batch.id > unique_batches[key].id:
-                        unique_batches[key] = batch
-                else:
-                    unique_batches[key] = batch
+            batch_results = self._dedupe_batches(batch_results)
+            self.batch_results = batch_results
+            return batch_results
+
+        except requests.RequestException as e:
+            self.logger.error("Error during status check: %s", e)
+            raise
+
+    def list_requests(self) -> List[Dict[str, Any]]:
+        """
+        List the recent document parsing requests of this API key.
 
-            self.batch_results = sorted(unique_batches.values(), key=lambda x: x.id)
-            return self.batch_results
+        Returns:
+            List[Dict[str, Any]]: One entry per request as returned by the API,
+                including its id and status
 
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        try:
+            response_data, _ = self._get_json(self._list_url)
         except requests.RequestException as e:
-            self.logger.error(f"Error during status check: {e}")
+            self.logger.error("Error listing requests: %s", e)
             raise
+        return response_data.get("requests", [])
 
-    def download(
-        self,
-        request_id: Optional[str] = None,
-        batch_results: Optional[List[BatchResult]] = None,
-        temp_dir: str = "temp",
-    ) -> List[Dict[str, Any]]:
+    def check_status_bulk(self, request_ids: List[str]) -> Dict[str, Optional[str]]:
         """
-        Download the results of a document parsing request.
+        Check the status of several requests with a single API call.
+
+        The API has no multi-document upload, but the request list reports the
+        status of every request, so N polls collapse into one. Batch details are
+        not included; use check_status() for a request that needs them.
 
         Args:
-            request_id (Optional[str]): The request ID to download results for. If None, uses the last request_id.
-            batch_results (Optional[List[BatchResult]]): Batch results to download. If None, uses the last batch_results.
-            temp_dir (str): Directory for temporary files. Defaults to "temp".
+            request_ids (List[str]): The request IDs to check
 
         Returns:
-            List[Dict[str, Any]]: A list of downloaded batch data
+            Dict[str, Optional[str]]: Status by request ID; None for IDs the request
+                list does not contain
 
         Raises:
-            ValueError: If no request ID is available
-            requests.RequestException: If the download fails
-            json.JSONDecodeError: If the downloaded data is not valid JSON
+            requests.RequestException: If the API request fails
         """
-        request_id = request_id or self.request_id
-        if not request_id:
-            raise ValueError(
-                "No request ID available. Call request() first or provide a request ID."
+        statuses = {
+            entry.get("id"): entry.get("status") for entry in self.list_requests()
+        }
+        return {request_id: statuses.get(request_id) for request_id in request_ids}
+
+    @staticmethod
+    def _raise_if_failed(request_id: str, response_data: Dict[str, Any]) -> None:
+        """
+        Fail fast when a status response reports a failed request or batch.
+
+        A failed batch is never retried by the API, so waiting for it to complete
+        would only run into max_wait.
+
+        Args:
+            request_id (str): The request ID the response belongs to
+            response_data (Dict[str, Any]): Parsed status response
+
+        Raises:
+            ValueError: If the request or any of its batches has failed
+        """
+        if response_data.get("status") == "failed":
+            raise ValueError(
+                f"Request {request_id} failed: "
+                f"{response_data.get('failure_message') or 'no reason given'}"
+            )
+        failed = [
+            batch.get("id")
+            for batch in response_data.get("batches", [])
+            if batch.get("status") == "failed"
+        ]
+        if failed:
+            raise ValueError(f"Request {request_id} has failed batches: {failed}")
+
+    def _parse_batches(self, response_data: Dict[str, Any]) -> List[BatchResult]:
+        """
+        Build batch results from a status response.
+
+        Args:
+            response_data (Dict[str, Any]): Parsed status response
+
+        Returns:
+            List[BatchResult]: One result per batch in the response
+
+        Raises:
+            ValueError: If the response has no batch information
+        """
+        if "batches" not in response_data:
+            raise ValueError(f"API response missing batch information: {response_data}")
+
+        batch_results = []
+        for batch in response_data["batches"]:
+            result = BatchResult(
+                id=batch["id"],
+                status=batch["status"],
+                start_page=batch.get("start_page"),
+                end_page=batch.get("end_page"),
+                download_url=batch.get("download_url"),
+            )
+            if result.status == "completed":
+                self.logger.info(
+                    "Batch %s completed: Pages %s-%s",
+                    result.id,
+                    result.start_page,
+                    result.end_page,
+                )
+                self.logger.debug("Download URL: %s", result.download_url)
+            batch_results.append(result)
+        return batch_results
+
+    def _apply_batch_updates(
+        self,
+        batch_by_id: Dict[int, BatchResult],
+        updated_batches: List[Dict[str, Any]],
+        elapsed: Optional[float] = None,
+    ) -> bool:
+        """
+        Update known batch results in place from a status response.
+
+        Args:
+            batch_by_id (Dict[int, BatchResult]): Known batch results keyed by batch ID
+            updated_batches (List[Dict[str, Any]]): The "batches" list of a status response
+            elapsed (Optional[float]): Seconds since status checks began. If given,
+                newly completed batches are added to the completion history.
+
+        Returns:
+            bool: True if any batch completed with this update
+        """
+        newly_completed = False
+        for updated_batch in updated_batches:
+            result = batch_by_id.get(updated_batch["id"])
+            if result is None:
+                continue
+            previous_status = result.status
+            result.status = updated_batch["status"]
+            if previous_status != result.status:
+                self.logger.debug(
+                    "Batch %s status changed: %s -> %s",
+                    result.id,
+                    previous_status,
+                    result.status,
+                )
+            if result.status == "completed" and previous_status != "completed":
+                newly_completed = True
+                if elapsed is not None:
+                    self._completion_history.append(
+                        (self._batch_pages(result), elapsed)
+                    )
+            if result.status == "completed" and "download_url" in updated_batch:
+                result.download_url = updated_batch["download_url"]
+                self.logger.info(
+                    "Batch %s completed: Pages %s-%s",
+                    result.id,
+                    updated_batch.get("start_page"),
+                    updated_batch.get("end_page"),
+                )
+                self.logger.debug("Download URL: %s", result.download_url)
+        return newly_completed
+
+    @staticmethod
+    def _dedupe_batches(batch_results: List[BatchResult]) -> List[BatchResult]:
+        """
+        Remove duplicate batches covering the same page range.
+
+        If multiple batches have the same (start_page, end_page), keep only the one
+        with the highest batch ID.
+
+        Args:
+            batch_results (List[BatchResult]): Batch results to filter
+
+        Returns:
+            List[BatchResult]: The remaining batches sorted by ID
+        """
+        unique_batches = {}
+        for batch in batch_results:
+            key = (batch.start_page, batch.end_page)
+            if key in unique_batches:
+                if batch.id > unique_batches[key].id:
+                    unique_batches[key] = batch
+            else:
+                unique_batches[key] = batch
+        return sorted(unique_batches.values(), key=lambda x: x.id)
+
+    async def acheck_status(
+        self,
+        request_id: Optional[str] = None,
+        wait: bool = False,
+        poll_interval: int = 1,
+        max_wait: int = 300,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> List[BatchResult]:
+        """
+        Asynchronous version of check_status() built on httpx.
+
+        Polling sleeps with asyncio.sleep, so many requests can be awaited on one
+        event loop thread.
+
+        Args:
+            request_id (Optional[str]): The request ID to check. If None, uses the last request_id.
+            wait (bool): Whether to wait for processing to complete. Defaults to False.
+            poll_interval (int): Upper bound in seconds on the delay between status checks when
+                waiting. Defaults to 1.
+            max_wait (int): Maximum number of seconds to wait for completion. Defaults to 300.
+            client (Optional[httpx.AsyncClient]): Client to reuse. If None, a temporary one is created.
+
+        Returns:
+            List[BatchResult]: A list of batch processing results
+
+        Raises:
+            ValueError: If no request ID is available, or the request or one of its
+                batches has failed
+            httpx.HTTPError: If the API request fails
+            TimeoutError: If waiting times out
+        """
+        request_id = request_id or self.request_id
+        if not request_id:
+            raise ValueError(
+                "No request ID available. Call request() first or provide a request ID."
+            )
+        if client is None:
+            async with self._async_client() as client:
+                return await self.acheck_status(
+                    request_id, wait, poll_interval, max_wait, client
+                )
+
+        url = self._status_url % request_id
+        start_time = time.time()
+        attempt = 0
+        error_delay = 0
+        batch_results = None
+        batch_by_id = {}
+        schedule = []
+        while True:
+            try:
+                response_data, modified = await self._aget_json(client, url)
+            except httpx.HTTPError as e:
+                if batch_results is None and attempt == 0:
+                    self.logger.error("Error during status check: %s", e)
+                    raise
+                if not self._is_transient_async_error(e):
+                    raise
+                if time.time() - start_time > max_wait:
+                    raise TimeoutError(
+                        "Status checks kept failing. Maximum wait time exceeded."
+                    )
+                error_delay = min(POLL_ERROR_BACKOFF_MAX, error_delay * 2 or 1)
+                self.logger.warning(
+                    "Status poll failed (%s). Retrying in %s seconds...", e, error_delay
+                )
+                await asyncio.sleep(error_delay)
+                continue
+            error_delay = 0
+            # An unchanged response needs no processing once batches are known
+            if modified or batch_results is None:
+                self._raise_if_failed(request_id, response_data)
+                if response_data.get("status") != "submitted" or not wait:
+                    if batch_results is None:
+                        batch_results = self._parse_batches(response_data)
+                        batch_by_id = {result.id: result for result in batch_results}
+                        schedule = self._poll_schedule(batch_results)
+                    elif self._apply_batch_updates(
+                        batch_by_id,
+                        response_data.get("batches", []),
+                        time.time() - start_time,
+                    ):
+                        attempt = 0
+                    if not wait or all(
+                        result.status == "completed" for result in batch_results
+                    ):
+                        break
+
+            elapsed = time.time() - start_time
+            if elapsed > max_wait:
+                raise TimeoutError(
+                    "Not all batches have completed processing. Maximum wait time exceeded."
+                )
+            await asyncio.sleep(
+                self._next_poll_delay(schedule, elapsed, attempt, poll_interval)
+            )
+            attempt += 1
+
+        batch_results = self._dedupe_batches(batch_results)
+        self.batch_results = batch_results
+        return batch_results
+
+    async def adownload(
+        self,
+        request_id: Optional[str] = None,
+        batch_results: Optional[List[BatchResult]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronous version of download() built on httpx.
+
+        All completed batches are fetched concurrently with asyncio.gather.
+
+        Args:
+            request_id (Optional[str]): The request ID to download results for. If None, uses the last request_id.
+            batch_results (Optional[List[BatchResult]]): Batch results to download.
+                If None, checks the request status first.
+            client (Optional[httpx.AsyncClient]): Client to reuse. If None, a temporary one is created.
+
+        Returns:
+            List[Dict[str, Any]]: A list of downloaded batch data, in batch order
+
+        Raises:
+            ValueError: If no request ID is available
+            httpx.HTTPError: If a download fails
+            json.JSONDecodeError: If downloaded data is not valid JSON
+        """
+        request_id = request_id or self.request_id
+        if not request_id:
+            raise ValueError(
+                "No request ID available. Call request() first or provide a request ID."
+            )
+        if client is None:
+            async with self._async_client() as client:
+                return await self.adownload(request_id, batch_results, client)
+
+        if not batch_results:
+            batch_results = await self.acheck_status(request_id, client=client)
+
+        async def fetch(result: BatchResult) -> Dict[str, Any]:
+            self.logger.info("Downloading batch %s...", result.id)
+            response = await client.get(result.download_url)
+            response.raise_for_status()
+            self.logger.info("Successfully downloaded batch %s", result.id)
+            return _json_loads(response.content)
+
+        try:
+            return list(
+                await asyncio.gather(
+                    *(
+                        fetch(result)
+                        for result in batch_results
+                        if result.status == "completed" and result.download_url
+                    )
+                )
+            )
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            self.logger.error("Failed to download batches: %s", e)
+            raise
+
+    async def await_and_download(
+        self,
+        request_id: Optional[str] = None,
+        poll_interval: int = 1,
+        max_wait: int = 300,
+        rate_limit: float = ASYNC_RATE_LIMIT,
+        concurrency: int = ASYNC_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Wait for a request to complete and download all of its batches on one event loop.
+
+        Polling and downloads share a single client, so TLS connections are reused
+        across all of them (and multiplexed over HTTP/2 when h2 is installed).
+        Requests are throttled to `rate_limit` per second and at most
+        `concurrency` are in flight at once.
+
+        Args:
+            request_id (Optional[str]): The request ID to wait for. If None, uses the last request_id.
+            poll_interval (int): Upper bound in seconds on the delay between status checks.
+                Defaults to 1.
+            max_wait (int): Maximum number of seconds to wait for completion. Defaults to 300.
+            rate_limit (float): Maximum requests started per second. Defaults to ASYNC_RATE_LIMIT.
+            concurrency (int): Maximum requests in flight. Defaults to ASYNC_CONCURRENCY.
+
+        Returns:
+            List[Dict[str, Any]]: A list of downloaded batch data, in batch order
+
+        Raises:
+            ValueError: If no request ID is available
+            httpx.HTTPError: If a status check or download fails
+            TimeoutError: If waiting times out
+        """
+        async with self._async_client(
+            rate_limit=rate_limit, concurrency=concurrency
+        ) as client:
+            batch_results = await self.acheck_status(
+                request_id, True, poll_interval, max_wait, client
+            )
+            return await self.adownload(request_id, batch_results, client)
+
+    def wait_and_download(
+        self,
+        request_id: Optional[str] = None,
+        poll_interval: int = 1,
+        max_wait: int = 300,
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around await_and_download() for non-async callers.
+
+        Must not be called from a thread that is already running an event loop.
+
+        Args:
+            request_id (Optional[str]): The request ID to wait for. If None, uses the last request_id.
+            poll_interval (int): Upper bound in seconds on the delay between status checks.
+                Defaults to 1.
+            max_wait (int): Maximum number of seconds to wait for completion. Defaults to 300.
+
+        Returns:
+            List[Dict[str, Any]]: A list of downloaded batch data, in batch order
+        """
+        return asyncio.run(self.await_and_download(request_id, poll_interval, max_wait))
+
+    def _async_client(
+        self,
+        rate_limit: Optional[float] = None,
+        concurrency: Optional[int] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Create an httpx client configured like the synchronous session.
+
+        HTTP/2 is negotiated when the h2 package is installed, so concurrent status
+        polls and downloads are multiplexed over one connection per host.
+
+        Args:
+            rate_limit (Optional[float]): Maximum requests started per second.
+                None disables rate limiting.
+            concurrency (Optional[int]): Maximum requests in flight. None leaves it
+                to the connection pool.
+
+        Returns:
+            httpx.AsyncClient: Client with the authorization header and a shared
+                keep-alive connection pool
+        """
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+        if rate_limit is not None or concurrency is not None:
+            # With HTTP/2 one connection carries many requests, so the pool size
+            # cannot bound concurrency; the transport wrapper does that instead
+            transport = _ThrottledTransport(
+                transport,
+                _RateLimiter(rate_limit or float("inf")),
+                concurrency or 32,
+            )
+        return httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=ASYNC_TIMEOUT,
+            transport=transport,
+        )
+
+    def _get_json(self, url: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        GET a JSON resource, revalidating against the last response for the URL.
+
+        Args:
+            url (str): URL to fetch
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: The parsed body, and False if the server
+                answered 304 and the cached body was returned
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        cached = self._etags.check(url)
+        response = self.session.get(url, headers=cached[0] if cached else None)
+        self.logger.debug("GET %s -> %s", url, response.status_code)
+        if response.status_code == 304 and cached is not None:
+            return cached[1], False
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        self._remember_validators(url, response.headers, data)
+        return data, True
+
+    async def _aget_json(
+        self, client: httpx.AsyncClient, url: str
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Asynchronous version of _get_json() built on httpx.
+
+        Args:
+            client (httpx.AsyncClient): Client to send the request with
+            url (str): URL to fetch
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: The parsed body, and False if the server
+                answered 304 and the cached body was returned
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        cached = self._etags.check(url)
+        response = await client.get(url, headers=cached[0] if cached else None)
+        # httpx treats 304 as an error status; here it just means "unchanged"
+        if response.status_code == 304 and cached is not None:
+            return cached[1], False
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        self._remember_validators(url, response.headers, data)
+        return data, True
+
+    def _remember_validators(
+        self, url: str, headers: Mapping[str, str], data: Dict[str, Any]
+    ) -> None:
+        """
+        Store the validators of a JSON response for later conditional requests.
+
+        Args:
+            url (str): URL the response came from
+            headers (Mapping[str, str]): Response headers
+            data (Dict[str, Any]): Parsed response body
+        """
+        conditional = {}
+        if headers.get("ETag"):
+            conditional["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        if conditional:
+            self._etags.set(url, (conditional, data))
+        else:
+            self._etags.evict(url)
+
+    @staticmethod
+    def _is_transient_async_error(error: httpx.HTTPError) -> bool:
+        """
+        Check whether a failed asynchronous status poll is worth retrying.
+
+        Args:
+            error (httpx.HTTPError): The exception raised by the poll
+
+        Returns:
+            bool: True for transport errors and 429/5xx responses
+        """
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return False
+
+    @staticmethod
+    def _batch_pages(result: BatchResult) -> int:
+        """
+        Count the pages covered by a batch.
+
+        Args:
+            result (BatchResult): The batch
+
+        Returns:
+            int: Number of pages, or 1 if the page range is unknown
+        """
+        if result.start_page is None or result.end_page is None:
+            return 1
+        return max(1, result.end_page - result.start_page + 1)
+
+    def _poll_schedule(self, batch_results: List[BatchResult]) -> List[float]:
+        """
+        Plan poll times from the completion times of earlier batches.
+
+        Past completion times are normalized per page and scaled to the largest
+        pending batch. Polls are then placed at evenly spaced quantiles of that
+        distribution, up to the 99th percentile, so they cluster where completions
+        are likely instead of following a fixed interval.
+
+        Args:
+            batch_results (List[BatchResult]): Batches of the request being polled
+
+        Returns:
+            List[float]: Increasing poll times in seconds since status checks began,
+                or an empty list if there is not enough history
+        """
+        history = list(self._completion_history)
+        if len(history) < POLL_SCHEDULE_MIN_SAMPLES:
+            return []
+        pages = max(
+            (
+                self._batch_pages(result)
+                for result in batch_results
+                if result.status != "completed"
+            ),
+            default=1,
+        )
+        expected = sorted(seconds / count * pages for count, seconds in history)
+        n = len(expected)
+        return sorted(
+            {
+                expected[min(n - 1, int(0.99 * i / POLL_SCHEDULE_POINTS * n))]
+                for i in range(1, POLL_SCHEDULE_POINTS + 1)
+            }
+        )
+
+    @classmethod
+    def _next_poll_delay(
+        cls,
+        schedule: List[float],
+        elapsed: float,
+        attempt: int,
+        poll_interval: float,
+    ) -> float:
+        """
+        Compute the delay before the next status poll.
+
+        Follows the adaptive schedule while it has points left, and falls back to
+        exponential backoff afterwards or when there is no schedule.
+
+        Args:
+            schedule (List[float]): Poll times from _poll_schedule()
+            elapsed (float): Seconds since status checks began
+            attempt (int): Number of polls made since the last backoff reset
+            poll_interval (float): Maximum delay in seconds
+
+        Returns:
+            float: Seconds to sleep before polling again
+        """
+        for point in schedule:
+            if point > elapsed:
+                return min(poll_interval, max(POLL_BACKOFF_MIN, point - elapsed))
+        return cls._poll_delay(attempt, poll_interval)
+
+    @staticmethod
+    def _poll_delay(attempt: int, poll_interval: float) -> float:
+        """
+        Compute the delay before the next status poll.
+
+        Args:
+            attempt (int): Number of polls made since the last reset
+            poll_interval (float): Maximum delay in seconds
+
+        Returns:
+            float: Seconds to sleep before polling again
+        """
+        return min(poll_interval, POLL_BACKOFF_MIN * (POLL_BACKOFF_BASE**attempt))
+
+    @staticmethod
+    def _is_stale_request_error(error: Exception) -> bool:
+        """
+        Check whether a status check failure means a request must not be reused.
+
+        Args:
+            error (Exception): The exception raised by check_status()
+
+        Returns:
+            bool: True for timeouts, failed or malformed requests and 4xx responses
+                other than 429
+        """
+        if isinstance(error, (TimeoutError, ValueError)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status_code = error.response.status_code
+            return 400 <= status_code < 500 and status_code != 429
+        return False
+
+    @staticmethod
+    def _is_transient_error(error: requests.RequestException) -> bool:
+        """
+        Check whether a failed status poll is worth retrying.
+
+        Args:
+            error (requests.RequestException): The exception raised by the poll
+
+        Returns:
+            bool: True for connection errors, timeouts, exhausted adapter retries
+                and 429/5xx responses
+        """
+        if isinstance(
+            error,
+            (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.RetryError,
+            ),
+        ):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return False
+
+    def download(
+        self,
+        request_id: Optional[str] = None,
+        batch_results: Optional[List[BatchResult]] = None,
+        temp_dir: str = "temp",
+    ) -> List[Dict[str, Any]]:
+        """
+        Download the results of a document parsing request.
+
+        Args:
+            request_id (Optional[str]): The request ID to download results for. If None, uses the last request_id.
+            batch_results (Optional[List[BatchResult]]): Batch results to download. If None, uses the last batch_results.
+            temp_dir (str): Directory for temporary files. Defaults to "temp".
+
+        Returns:
+            List[Dict[str, Any]]: A list of downloaded batch data
+
+        Raises:
+            ValueError: If no request ID is available
+            requests.RequestException: If the download fails
+            json.JSONDecodeError: If the downloaded data is not valid JSON
+        """
+        request_id = request_id or self.request_id
+        if not request_id:
+            raise ValueError(
+                "No request ID available. Call request() first or provide a request ID."
             )
 
         batch_results = batch_results or self.batch_results
@@ -467,77 +1789,181 @@ class UpstageDocumentParseClient:
         ]
         if incomplete_batches:
             self.logger.warning(
-                f"{len(incomplete_batches)} batches are not completed or missing download URL."
+                "%s batches are not completed or missing download URL.",
+                len(incomplete_batches),
             )
             for batch in incomplete_batches:
                 self.logger.debug(
-                    f"Incomplete batch ID: {batch.id}, Status: {batch.status}, URL: {batch.download_url}"
+                    "Incomplete batch ID: %s, Status: %s, URL: %s",
+                    batch.id,
+                    batch.status,
+                    batch.download_url,
                 )
 
         temp_path = Path(temp_dir)
         temp_path.mkdir(parents=True, exist_ok=True)
-        self.logger.debug(f"Created temporary directory: {temp_path.absolute()}")
+        self.logger.debug("Created temporary directory: %s", temp_path.absolute())
 
-        downloaded_data = []
-        temp_files = []
+        to_fetch = [
+            result
+            for result in batch_results
+            if result.status == "completed" and result.download_url
+        ]
+        if len(to_fetch) <= 1:
+            # Nothing to overlap; skip the thread pool setup
+            fetched = [
+                self._fetch_batch(result, temp_path, request_id) for result in to_fetch
+            ]
+        else:
+            # Batches are independent, so fetch them concurrently over the shared session
+            with ThreadPoolExecutor(
+                max_workers=min(DOWNLOAD_WORKERS, len(to_fetch))
+            ) as executor:
+                futures = [
+                    executor.submit(self._fetch_batch, result, temp_path, request_id)
+                    for result in to_fetch
+                ]
+                # Futures are collected in submission order, which keeps batch order
+                fetched = [future.result() for future in futures]
+
+        downloaded_data = [parsed_data for parsed_data, _ in fetched]
+        temp_files = [temp_file for _, temp_file in fetched if temp_file]
+
+        if self.debug:
+            self.logger.debug(
+                "Debug mode: Preserving temporary files: %s",
+                ", ".join(str(f) for f in temp_files),
+            )
 
-        for result in batch_results:
-            if result.status == "completed" and result.download_url:
-                try:
-                    self.logger.info(f"Downloading batch {result.id}...")
-                    self.logger.debug(f"Download URL: {result.download_url}")
-                    download_response = self.session.get(result.download_url)
-                    download_response.raise_for_status()
-                    content_type = download_response.headers.get("Content-Type", "")
-                    self.logger.debug(f"Content type: {content_type}")
-
-                    if "application/json" in content_type:
-                        parsed_data = download_response.json()
-                    else:
-                        parsed_data = json.loads(download_response.text)
+        return downloaded_data
 
-                    if self.debug:
-                        temp_filename = (
-                            temp_path / f"batch_{result.id}_{request_id}.json"
-                        )
-                        with open(temp_filename, "w", encoding="utf-8") as f:
-                            f.write(
-                                json.dumps(parsed_data, ensure_ascii=False, indent=2)
-                            )
-                        temp_files.append(temp_filename)
-                        self.logger.debug(
-                            f"Debug mode: Saved temporary file: {temp_filename}"
-                        )
+    def _fetch_batch(
+        self, result: BatchResult, temp_path: Path, request_id: str
+    ) -> Tuple[Dict[str, Any], Optional[Path]]:
+        """
+        Download and parse a single completed batch.
 
-                    downloaded_data.append(parsed_data)
-                    self.logger.info(f"Successfully downloaded batch {result.id}")
-                except requests.RequestException as e:
-                    self.logger.error(f"Failed to download batch {result.id}: {e}")
-                    raise
-                except json.JSONDecodeError as e:
-                    self.logger.error(f"JSON parsing failed: {e}")
-                    raise
-                except Exception as e:
-                    self.logger.error(
-                        f"Error processing batch {result.id}: {type(e).__name__}: {e}"
-                    )
-                    raise
+        The response body is streamed into a single growing buffer and parsed from
+        the raw bytes, without a decoded text copy. In debug mode it is streamed to a
+        file in temp_path instead, which is kept for inspection.
 
-        if not self.debug:
-            for temp_file in temp_files:
-                try:
-                    os.remove(temp_file)
-                    self.logger.debug(f"Deleted temporary file: {temp_file}")
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to delete temporary file: {temp_file} - {e}"
+        Args:
+            result (BatchResult): The completed batch to download
+            temp_path (Path): Directory for the debug copy of the batch data
+            request_id (str): The request ID the batch belongs to
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[Path]]: The parsed batch data and the debug
+                file it was saved to, if any
+
+        Raises:
+            requests.RequestException: If the download fails
+            json.JSONDecodeError: If the downloaded data is not valid JSON
+        """
+        temp_filename = None
+        try:
+            self.logger.info("Downloading batch %s...", result.id)
+            self.logger.debug("Download URL: %s", result.download_url)
+            with self.session.get(
+                result.download_url, stream=True
+            ) as download_response:
+                download_response.raise_for_status()
+                content_type = download_response.headers.get("Content-Type", "")
+                self.logger.debug("Content type: %s", content_type)
+                chunks = download_response.iter_content(DOWNLOAD_CHUNK_SIZE)
+                if self.debug:
+                    temp_filename = temp_path / f"batch_{result.id}_{request_id}.json"
+                    with open(temp_filename, "wb") as f:
+                        f.writelines(chunks)
+                    body = temp_filename.read_bytes()
+                    self.logger.debug(
+                        "Debug mode: Saved temporary file: %s", temp_filename
                     )
-        else:
-            self.logger.debug(
-                f"Debug mode: Preserving temporary files: {', '.join(str(f) for f in temp_files)}"
+                else:
+                    body = bytearray()
+                    for chunk in chunks:
+                        body.extend(chunk)
+
+            # orjson parses the raw bytes directly, skipping a separate UTF-8 decode
+            parsed_data = _json_loads(body)
+            self.logger.info("Successfully downloaded batch %s", result.id)
+            return parsed_data, temp_filename
+        except requests.RequestException as e:
+            self.logger.error("Failed to download batch %s: %s", result.id, e)
+            raise
+        except json.JSONDecodeError as e:
+            self.logger.error("JSON parsing failed: %s", e)
+            raise
+        except Exception as e:
+            self.logger.error(
+                "Error processing batch %s: %s: %s", result.id, type(e).__name__, e
             )
+            raise
 
-        return downloaded_data
+    def stream_results_to_dir(
+        self,
+        request_id: Optional[str] = None,
+        batch_results: Optional[List[BatchResult]] = None,
+        output_dir: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Save the raw batch results of a request to disk without parsing them.
+
+        Each completed batch is streamed from the HTTP response straight into
+        `batch_{id}_{request_id}.json`, skipping the JSON decode/encode round trip
+        of download(). Use this when only the files on disk are needed.
+
+        Args:
+            request_id (Optional[str]): The request ID to save results for. If None, uses the last request_id.
+            batch_results (Optional[List[BatchResult]]): Batch results to save. If None, uses the last batch_results.
+            output_dir (Optional[str]): Directory to save the files in. If None, uses output_dir.
+
+        Returns:
+            List[str]: Paths of the saved files, in batch order
+
+        Raises:
+            ValueError: If no request ID is available
+            requests.RequestException: If a download fails
+        """
+        request_id = request_id or self.request_id
+        if not request_id:
+            raise ValueError(
+                "No request ID available. Call request() first or provide a request ID."
+            )
+
+        batch_results = batch_results or self.batch_results
+        if not batch_results:
+            self.logger.info("No batch results available. Checking status.")
+            batch_results = self.check_status(request_id)
+
+        output_path = Path(output_dir or self.output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        def save(result: BatchResult) -> str:
+            path = output_path / f"batch_{result.id}_{request_id}.json"
+            self.logger.info("Saving batch %s to %s...", result.id, path)
+            # iter_content (unlike response.raw) undoes any Content-Encoding
+            with self.session.get(result.download_url, stream=True) as response:
+                response.raise_for_status()
+                with open(path, "wb") as f:
+                    f.writelines(response.iter_content(DOWNLOAD_CHUNK_SIZE))
+            return str(path)
+
+        to_save = [
+            result
+            for result in batch_results
+            if result.status == "completed" and result.download_url
+        ]
+        if not to_save:
+            return []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(DOWNLOAD_WORKERS, len(to_save))
+            ) as executor:
+                return list(executor.map(save, to_save))
+        except requests.RequestException as e:
+            self.logger.error("Failed to save batch results: %s", e)
+            raise
 
     def merge_results(
         self, downloaded_data: Optional[List[Dict[str, Any]]] = None
@@ -545,9 +1971,12 @@ class UpstageDocumentParseClient:
         """
         Merge downloaded batch results into a single result.
 
+        Entries are removed from downloaded_data as they are merged, so each parsed
+        batch can be garbage-collected before the merge finishes.
+
         Args:
             downloaded_data (Optional[List[Dict[str, Any]]]): List of downloaded batch data.
-                If None, automatically downloads the data.
+                If None, automatically downloads the data. The list is emptied.
 
         Returns:
             Dict[str, Dict[str, str]]: Merged results by format type (e.g., 'html', 'markdown', 'text')
@@ -560,37 +1989,46 @@ class UpstageDocumentParseClient:
             self.logger.warning("No data to merge.")
             return {}
 
-        self.logger.debug(f"Merging {len(downloaded_data)} data items")
+        self.logger.debug("Merging %s data items", len(downloaded_data))
         result_formats = set()
         for data in downloaded_data:
             if "content" in data:
                 result_formats.update(data["content"].keys())
 
-        self.logger.debug(f"Available formats: {result_formats}")
+        self.logger.debug("Available formats: %s", result_formats)
         merged_results = {fmt: [] for fmt in result_formats}
 
-        for i, data in enumerate(downloaded_data):
-            self.logger.debug(f"Processing data {i+1}/{len(downloaded_data)}")
+        total = len(downloaded_data)
+        downloaded_data.reverse()
+        for i in range(total):
+            data = downloaded_data.pop()
+            self.logger.debug("Processing data %s/%s", i + 1, total)
             if "content" in data:
                 for fmt in result_formats:
                     if fmt in data["content"]:
                         self.logger.debug(
-                            f"{fmt} content size: {len(data['content'][fmt])} characters"
+                            "%s content size: %s characters",
+                            fmt,
+                            len(data["content"][fmt]),
                         )
                         merged_results[fmt].append(data["content"][fmt])
             else:
-                self.logger.warning(f"Data missing 'content' key: {list(data.keys())}")
+                self.logger.warning("Data missing 'content' key: %s", list(data.keys()))
 
         result = {}
-        for fmt, contents in merged_results.items():
+        for fmt in list(merged_results):
+            contents = merged_results.pop(fmt)
             if contents:
+                # str.join sizes its output once up front; dropping the per-batch
+                # pieces right after keeps only one format's pieces alive at a time
                 merged_content = "\n\n".join(contents)
+                contents.clear()
                 result[fmt] = {"content": merged_content}
                 self.logger.debug(
-                    f"{fmt} merged result size: {len(merged_content)} characters"
+                    "%s merged result size: %s characters", fmt, len(merged_content)
                 )
             else:
-                self.logger.warning(f"No content for format {fmt}.")
+                self.logger.warning("No content for format %s.", fmt)
         return result
 
     def export(
@@ -615,12 +2053,12 @@ class UpstageDocumentParseClient:
         """
         output_path = Path(self.output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
-        self.logger.debug(f"Created output directory: {output_path.absolute()}")
+        self.logger.debug("Created output directory: %s", output_path.absolute())
 
         if not filename:
             filename = self.request_id or f"parsed_document_{int(time.time())}"
         filename = Path(filename).stem
-        self.logger.debug(f"Output filename: {filename}")
+        self.logger.debug("Output filename: %s", filename)
 
         if not merged_results:
             self.logger.info("No merged results provided. Merging automatically.")
@@ -631,38 +2069,164 @@ class UpstageDocumentParseClient:
             return {}
 
         available_formats = set(merged_results.keys())
-        self.logger.debug(f"Available formats: {available_formats}")
+        self.logger.debug("Available formats: %s", available_formats)
 
         export_formats = (
             set(formats) & available_formats if formats else available_formats
         )
         if not export_formats:
             self.logger.warning(
-                f"Requested formats do not match available formats. Available formats: {available_formats}"
+                "Requested formats do not match available formats. Available formats: %s",
+                available_formats,
             )
             return {}
 
-        self.logger.debug(f"Formats to export: {export_formats}")
+        self.logger.debug("Formats to export: %s", export_formats)
         exported_files = {}
 
         for fmt in export_formats:
-            ext = (
-                "md"
-                if fmt == "markdown"
-                else "html" if fmt == "html" else "txt" if fmt == "text" else fmt
-            )
-            output_file = output_path / f"{filename}.{ext}"
+            output_file = output_path / f"{filename}.{EXPORT_EXTENSIONS.get(fmt, fmt)}"
             try:
                 with open(output_file, "w", encoding="utf-8") as f:
                     content = merged_results[fmt]["content"]
                     f.write(content)
-                    self.logger.debug(f"{fmt} content size: {len(content)} characters")
-                self.logger.info(f"{fmt.capitalize()} file created: {output_file}")
+                    self.logger.debug(
+                        "%s content size: %s characters", fmt, len(content)
+                    )
+                self.logger.info("%s file created: %s", fmt.capitalize(), output_file)
                 exported_files[fmt] = str(output_file)
             except Exception as e:
-                self.logger.error(f"Error creating {fmt} file: {e}")
+                self.logger.error("Error creating %s file: %s", fmt, e)
         return exported_files
 
+    def _stream_export(
+        self,
+        request_id: str,
+        batch_results: List[BatchResult],
+        filename: str,
+        formats: Optional[List[str]] = None,
+        temp_dir: str = "temp",
+        to_memory: bool = False,
+    ) -> Union[Dict[str, str], Dict[str, bytes]]:
+        """
+        Download, merge and export batch results in a single streaming pass.
+
+        Equivalent to download() → merge_results() → export(), but each batch is
+        appended to the output files as soon as it and all earlier batches have
+        arrived, so neither the full set of parsed batches nor the merged strings
+        are ever held in memory. With to_memory, batches are appended to in-memory
+        UTF-8 buffers instead and nothing is written to output_dir.
+
+        Args:
+            request_id (str): The request ID the batches belong to
+            batch_results (List[BatchResult]): Batch results to download, in page order
+            filename (str): Base filename for output files
+            formats (Optional[List[str]]): List of formats to export.
+                If None, exports all available formats.
+            temp_dir (str): Directory for temporary files. Defaults to "temp".
+            to_memory (bool): Whether to return the content instead of writing files.
+                Defaults to False.
+
+        Returns:
+            Union[Dict[str, str], Dict[str, bytes]]: Dictionary mapping format names to
+                exported file paths, or to UTF-8 encoded content with to_memory
+
+        Raises:
+            requests.RequestException: If a download fails
+            json.JSONDecodeError: If downloaded data is not valid JSON
+        """
+        output_path = Path(self.output_dir)
+        if not to_memory:
+            output_path.mkdir(parents=True, exist_ok=True)
+        temp_path = Path(temp_dir)
+        if self.debug:
+            temp_path.mkdir(parents=True, exist_ok=True)
+        filename = Path(filename).stem
+
+        to_fetch = [
+            result
+            for result in batch_results
+            if result.status == "completed" and result.download_url
+        ]
+        if len(to_fetch) != len(batch_results):
+            self.logger.warning(
+                "%s batches are not completed or missing download URL.",
+                len(batch_results) - len(to_fetch),
+            )
+
+        output_files = {}
+        handles = {}
+        pending = []
+        next_index = 0
+
+        def write_batch(data: Dict[str, Any]) -> None:
+            content = data.get("content")
+            if content is None:
+                self.logger.warning("Data missing 'content' key: %s", list(data.keys()))
+                content = {}
+            for fmt, text in content.items():
+                if formats and fmt not in formats:
+                    continue
+                f = handles.get(fmt)
+                if f is None:
+                    if to_memory:
+                        f = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", newline="")
+                    else:
+                        output_file = (
+                            output_path
+                            / f"{filename}.{EXPORT_EXTENSIONS.get(fmt, fmt)}"
+                        )
+                        f = open(output_file, "w", encoding="utf-8")
+                        output_files[fmt] = str(output_file)
+                    handles[fmt] = f
+                else:
+                    f.write("\n\n")
+                f.write(text)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(DOWNLOAD_WORKERS, len(to_fetch)) or 1
+            ) as executor:
+                futures = {
+                    executor.submit(self._fetch_batch, result, temp_path, request_id): i
+                    for i, result in enumerate(to_fetch)
+                }
+                # Batches finish out of order; hold early arrivals in a heap keyed on
+                # their position and flush whenever the next batch in sequence is ready
+                for future in as_completed(futures):
+                    data, _ = future.result()
+                    heapq.heappush(pending, (futures[future], data))
+                    while pending and pending[0][0] == next_index:
+                        write_batch(heapq.heappop(pending)[1])
+                        next_index += 1
+        except Exception:
+            for f in handles.values():
+                f.close()
+            # Never leave truncated output behind for the result cache to pick up
+            for output_file in output_files.values():
+                try:
+                    os.remove(output_file)
+                except OSError:
+                    pass
+            raise
+
+        if to_memory:
+            contents = {}
+            for fmt, f in handles.items():
+                f.flush()
+                contents[fmt] = f.buffer.getvalue()
+                f.close()
+            if not contents:
+                self.logger.warning("No results to export.")
+            return contents
+
+        for fmt, f in handles.items():
+            f.close()
+            self.logger.info("%s file created: %s", fmt.capitalize(), output_files[fmt])
+        if not output_files:
+            self.logger.warning("No results to export.")
+        return output_files
+
     def process_document(
         self,
         file_path: str,
@@ -670,13 +2234,19 @@ class UpstageDocumentParseClient:
         poll_interval: int = 1,
         export_formats: Optional[List[str]] = None,
         max_wait: int = 300,
-    ) -> Dict[str, str]:
+        return_bytes: bool = False,
+    ) -> Union[Dict[str, str], Dict[str, bytes]]:
         """
         Process a document through the entire pipeline (request → status check → download → merge → export).
 
-        Uses caching to return cached results for identical inputs and options.
+        Uses caching to return cached results for identical inputs and options; the
+        cache is persisted in output_dir so it also survives across client instances.
         If any exported file has been deleted, invalidates the cache and regenerates.
 
+        With return_bytes, the merged content is returned in memory instead of being
+        exported. Cached exports are still used when available, but a fresh result
+        is not written to output_dir and therefore not cached.
+
         Args:
             file_path (str): Path to the document file to process
             wait (bool): Whether to wait for processing to complete. Defaults to True.
@@ -684,83 +2254,249 @@ class UpstageDocumentParseClient:
             export_formats (Optional[List[str]]): List of formats to export.
                 If None, exports all available formats.
             max_wait (int): Maximum number of seconds to wait for completion. Defaults to 300.
+            return_bytes (bool): Whether to return UTF-8 encoded content instead of
+                file paths. Defaults to False.
 
         Returns:
-            Dict[str, str]: Dictionary mapping format names to exported file paths
+            Union[Dict[str, str], Dict[str, bytes]]: Dictionary mapping format names to
+                exported file paths, or to UTF-8 encoded content with return_bytes
         """
-        print(f"process_document: {file_path}")
-        cache_key = self._generate_cache_key(file_path, export_formats)
-        self.logger.info(f"cache_key: {cache_key}")
-        self.logger.info(f"self._cache: {self._cache}")
+        self.logger.debug("process_document: %s", file_path)
+        cache_key = self._resolve_cache_key(file_path, export_formats)
+        self.logger.debug("cache_key: %s, cache size: %d", cache_key, len(self._cache))
+
+        cached_result = self._cache.check(cache_key)
+        if cached_result is None:
+            row = self._kv_get(cache_key)
+            if row and row[1]:
+                if time.time() - row[2] < self._cache_ttl:
+                    cached_result = _json_loads(row[1])
+                    self._cache.set(cache_key, cached_result, row[2])
+                else:
+                    self.logger.info("Cache expired: %s", cache_key)
+                    self._kv_delete(cache_key)
 
-        if cache_key in self._cache:
-            cached_result, timestamp = self._cache[cache_key]
+        if cached_result is not None:
             files_exist = all(os.path.exists(path) for path in cached_result.values())
             if not files_exist:
                 self.logger.info(
                     "Some cached files have been deleted. Invalidating cache."
                 )
-                del self._cache[cache_key]
-            elif time.time() - timestamp < self._cache_ttl:
+                self._cache.evict(cache_key)
+                self._kv_delete(cache_key)
+            else:
                 self.logger.info("Returning cached results.")
+                if return_bytes:
+                    contents = {}
+                    for fmt, path in cached_result.items():
+                        with open(path, "rb") as f:
+                            contents[fmt] = f.read()
+                    return contents
                 return cached_result
-            else:
-                self.logger.info(f"Cache expired: {cache_key}")
-                del self._cache[cache_key]
 
         try:
-            self.request(
-                file_path, wait=wait, poll_interval=poll_interval, max_wait=max_wait
+            # Thread the request ID and batch results explicitly so that concurrent
+            # calls sharing this client do not depend on the last-request attributes.
+            # The digest was memoized while resolving the cache key, so it is not
+            # recomputed; the upload streams the file from disk.
+            request_id, batch_results = self._submit(
+                file_path,
+                self._hash_file(file_path),
+                None,
+                wait=True,
+                poll_interval=poll_interval,
+                max_wait=max_wait,
             )
-            if not wait:
-                self.check_status(
-                    wait=True, poll_interval=poll_interval, max_wait=max_wait
-                )
-            downloaded_data = self.download()
-            merged_results = self.merge_results(downloaded_data)
-            filename = Path(file_path).name
-            exported_files = self.export(
-                filename=filename,
-                merged_results=merged_results,
+            exported_files = self._stream_export(
+                request_id,
+                batch_results,
+                filename=Path(file_path).name,
                 formats=export_formats,
+                to_memory=return_bytes,
             )
         except Exception as e:
-            self.logger.error(f"Error processing document: {e}")
+            self.logger.error("Error processing document: %s", e)
             raise
 
+        if return_bytes:
+            return exported_files
+
         # Cache the results
-        self._cache[cache_key] = (exported_files, time.time())
+        self._cache.set(cache_key, exported_files)
+        self._kv_put(cache_key, exported_json=_json_dumps_str(exported_files))
         return exported_files
 
-    def convert_to_markdown(self, file_path: str) -> str:
+    def _resolve_cache_key(
+        self, file_path: str, export_formats: Optional[List[str]]
+    ) -> str:
         """
-        Convert a document to markdown format.
+        Get the result cache key of a file, hashing its content only when needed.
 
-        Calls process_document() and returns the content of the markdown file if successful.
+        The key is looked up by file metadata first, so the content hash is only
+        computed the first time a given (file version, formats) pair is seen. A
+        modified file gets a new mtime and therefore a fresh key. The hash is
+        streamed from disk (see _hash_file()), so resolving a key that turns out to
+        be cached never holds the file in memory.
+
+        Args:
+            file_path (str): Path to the document file
+            export_formats (Optional[List[str]]): Requested export formats
+
+        Returns:
+            str: The result cache key
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat_key = self._stat_key(file_path, export_formats)
+        cache_key = self._stat_to_cachekey.check(stat_key)
+        if cache_key is not None:
+            return cache_key
+        file_hash = self._hash_file(file_path)
+        cache_key = self._generate_cache_key(file_path, export_formats, file_hash)
+        self._stat_to_cachekey.set(stat_key, cache_key)
+        return cache_key
+
+    @staticmethod
+    def _stat_key(
+        file_path: str, export_formats: Optional[List[str]]
+    ) -> Tuple[str, int, int, str]:
+        """
+        Build the metadata key under which a file's result cache key is memoized.
+
+        Args:
+            file_path (str): Path to the document file
+            export_formats (Optional[List[str]]): Requested export formats
+
+        Returns:
+            Tuple[str, int, int, str]: (absolute path, mtime_ns, size, export formats)
+
+        Raises:
+            OSError: If the file cannot be accessed
+        """
+        st = os.stat(file_path)
+        return (
+            os.path.abspath(file_path),
+            st.st_mtime_ns,
+            st.st_size,
+            json.dumps(export_formats, sort_keys=True),
+        )
+
+    def process_documents(
+        self,
+        file_paths: List[str],
+        poll_interval: int = 1,
+        export_formats: Optional[List[str]] = None,
+        max_wait: int = 300,
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Process several documents concurrently.
+
+        Each document goes through process_document() on a thread pool, so uploads,
+        status polling and downloads of different documents overlap and share this
+        client's connection pool. Result caching applies per document as usual.
+
+        Args:
+            file_paths (List[str]): Paths to the document files to process
+            poll_interval (int): Maximum number of seconds between status checks. Defaults to 1.
+            export_formats (Optional[List[str]]): List of formats to export.
+                If None, exports all available formats.
+            max_wait (int): Maximum number of seconds to wait for each document. Defaults to 300.
+
+        Returns:
+            Dict[str, Dict[str, str]]: Exported file paths by format, keyed by input path
+        """
+        unique_paths = list(dict.fromkeys(file_paths))
+        if not unique_paths:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(DOCUMENT_WORKERS, len(unique_paths))
+        ) as executor:
+            futures = {
+                path: executor.submit(
+                    self.process_document,
+                    path,
+                    poll_interval=poll_interval,
+                    export_formats=export_formats,
+                    max_wait=max_wait,
+                )
+                for path in unique_paths
+            }
+            return {path: future.result() for path, future in futures.items()}
+
+    def convert_to_bytes(self, file_path: str, export_format: str) -> Optional[bytes]:
+        """
+        Convert a document to the given format and return the UTF-8 encoded content.
+
+        Calls process_document() with return_bytes, so a fresh result is never
+        written to disk just to be read back, and callers that store or forward the
+        result never decode and re-encode it. Results are memoized by file content
+        and format, so converting the same document again returns immediately.
 
         Args:
             file_path (str): Path to the document file to process
+            export_format (str): Format to export ("markdown", "html" or "text")
 
         Returns:
-            str: Markdown content, or None if conversion fails
+            Optional[bytes]: UTF-8 encoded content, or None if conversion fails
         """
         try:
-            logging.info(f"convert_to_markdown: {file_path}")
-            exported_files = self.process_document(
-                file_path, export_formats=["markdown"], poll_interval=1
-            )
-            if "markdown" in exported_files:
-                md_file = exported_files["markdown"]
-                with open(md_file, "r", encoding="utf-8") as f:
-                    content = f.read()
+            # Keyed by content, so a copied or touched file still hits the memo; the
+            # key is memoized by file metadata for process_document() to reuse
+            cache_key = self._resolve_cache_key(file_path, [export_format])
+            content = self._render_cache.check(cache_key)
+            if content is not None:
+                self.logger.info("Returning memoized %s conversion.", export_format)
                 return content
+
+            contents = self.process_document(
+                file_path,
+                export_formats=[export_format],
+                poll_interval=1,
+                return_bytes=True,
+            )
+            if export_format in contents:
+                self._render_cache.set(cache_key, contents[export_format])
+                return contents[export_format]
             else:
-                self.logger.warning("No 'markdown' key in document processing results.")
+                self.logger.warning(
+                    "No '%s' key in document processing results.", export_format
+                )
                 return None
         except Exception as e:
-            self.logger.error(f"Error in convert_to_markdown: {e}")
+            self.logger.error("Error in convert_to_bytes (%s): %s", export_format, e)
             return None
 
+    def _convert_to_str(self, file_path: str, export_format: str) -> Optional[str]:
+        """
+        Convert a document to the given format and return the decoded content.
+
+        Args:
+            file_path (str): Path to the document file to process
+            export_format (str): Format to export ("markdown", "html" or "text")
+
+        Returns:
+            Optional[str]: Decoded content, or None if conversion fails
+        """
+        content = self.convert_to_bytes(file_path, export_format)
+        return content.decode("utf-8") if content is not None else None
+
+    def convert_to_markdown(self, file_path: str) -> str:
+        """
+        Convert a document to markdown format.
+
+        Calls process_document() and returns the content of the markdown file if successful.
+
+        Args:
+            file_path (str): Path to the document file to process
+
+        Returns:
+            str: Markdown content, or None if conversion fails
+        """
+        self.logger.info("convert_to_markdown: %s", file_path)
+        return self._convert_to_str(file_path, "markdown")
+
     def convert_to_html(self, file_path: str) -> str:
         """
         Convert a document to HTML format.
@@ -773,19 +2509,7 @@ class UpstageDocumentParseClient:
         Returns:
             str: HTML content, or None if conversion fails
         """
-        try:
-            exported_files = self.process_document(file_path, export_formats=["html"])
-            if "html" in exported_files:
-                html_file = exported_files["html"]
-                with open(html_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                return content
-            else:
-                self.logger.warning("No 'html' key in document processing results.")
-                return None
-        except Exception as e:
-            self.logger.error(f"Error in convert_to_html: {e}")
-            return None
+        return self._convert_to_str(file_path, "html")
 
     def convert_to_text(self, file_path: str) -> str:
         """
@@ -799,16 +2523,4 @@ class UpstageDocumentParseClient:
         Returns:
             str: Plain text content, or None if conversion fails
         """
-        try:
-            exported_files = self.process_document(file_path, export_formats=["text"])
-            if "text" in exported_files:
-                text_file = exported_files["text"]
-                with open(text_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                return content
-            else:
-                self.logger.warning("No 'text' key in document processing results.")
-                return None
-        except Exception as e:
-            self.logger.error(f"Error in convert_to_text: {e}")
-            return None
+        return self._convert_to_str(file_path, "text")